@@ -0,0 +1,5 @@
+"""
+DriftLab audio pipeline shared by the generate_*.py scripts.
+The scripts hold the SSML and register their tracks in audiogen.catalog;
+everything that turns SSML into finished MP3s lives here.
+"""
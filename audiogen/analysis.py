@@ -0,0 +1,57 @@
+"""
+Decoded-audio analysis: one decode pass per track, shared by every analyzer.
+
+An analyzer is a class built with the sample rate that gets
+feed(start, block) for each decoded block (start = index of its first
+sample) and then report(track, info) -> dict, merged into the track's build
+info like any post step ('problems' block publishing, 'warnings' are printed).
+
+A later post step that reads the decoded track sets `step.pcm = True`; the
+pipeline then runs intermediate() ahead of analyze(), decoding the track once
+to the PCM intermediate (audiogen.decode) at info['pcm'] that both share.
+Without such a step analyze() streams the MP3 and nothing is written to disk.
+
+Needs numpy and ffmpeg; the pipeline skips analysis when either is missing.
+"""
+import shutil
+
+
+def available():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return shutil.which('ffmpeg') is not None
+
+
+def analyzers():
+    from audiogen.envelope import Envelope
+    from audiogen.pacing import Pacing
+    from audiogen.qc import Quality
+    return [Pacing, Envelope, Quality]
+
+
+def needs_pcm(steps):
+    return any(getattr(step, 'pcm', False) for step in steps)
+
+
+def intermediate(track, path, info):
+    """Pipeline post step: decode `path` to the PCM intermediate the later steps share."""
+    from audiogen import decode
+    return {'pcm': decode.to_pcm(path)}
+
+
+def analyze(track, path, info):
+    """Pipeline post step: run every analyzer over one pass of the decoded track."""
+    from audiogen import decode
+    active = [cls(decode.SAMPLE_RATE) for cls in analyzers()]
+    for start, block in decode.blocks(info.get('pcm') or path):
+        for a in active:
+            a.feed(start, block)
+    out = {'problems': [], 'warnings': []}
+    for a in active:
+        report = dict(a.report(track, info) or {})
+        out['problems'] += report.pop('problems', [])
+        out['warnings'] += report.pop('warnings', [])
+        out.update(report)
+    return out
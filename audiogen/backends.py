@@ -0,0 +1,142 @@
+"""
+TTS backends. Each one turns a single SSML part into MP3 bytes:
+
+    backend.synthesize(ssml, voice, engine) -> bytes
+
+polly   Amazon Polly synthesize_speech (the default)
+tasks   Polly speech synthesis tasks on whole scripts (audiogen.polly_tasks)
+draft   offline and instant: a quiet tone while the script speaks, silence for
+        every <break>, timed by the duration model (audiogen.durations) from
+        word counts and prosody rate. For checking script timing and pipeline
+        changes without AWS credentials.
+
+Pick one with the pipeline's `backend` argument or DRIFTLAB_BACKEND.
+"""
+import os
+import time
+
+from audiogen import durations, mp3, ssml
+from audiogen.catalog import OUTPUT_DIR
+from audiogen.scheduler import WORKERS
+
+DRAFT_DIR = './driftlab-audio-draft'
+
+# One 24 kHz / 48 kbps mono frame of a 250 Hz sine at -18 dBFS, encoded by lame
+# with the bit reservoir off so it can be repeated (576 samples = 6 periods).
+TONE_FRAME = bytes.fromhex(
+    'fff364c4000fdc0e0420bd4a4447c23d60030784f08930192df0b1de9f19ffc287ffe37e9f47ffc6fff4'
+    'ffe35ffffff0bffe8dffab7fe3477ffffe3033ff1adffa3ffea3fff1a1bff857ff51e98829a8a665c62606'
+).ljust(144, b'\0')
+SILENT_FRAME = mp3.silence(576 / 24000)
+FRAME_SECONDS = 576 / 24000
+
+
+class Backend:
+    name = None
+    out_dir = OUTPUT_DIR
+
+    def prepare(self, tracks):
+        """Reshape tracks before scheduling (e.g. merge parts); identity by default."""
+        return tracks
+
+    def synthesize(self, ssml, voice, engine):
+        raise NotImplementedError
+
+    def request(self, ssml, voice, engine):
+        """synthesize() plus whatever the backend knows about the call: chars, ttfb, retries."""
+        return self.synthesize(ssml, voice, engine), {}
+
+    def reserve(self, workers):
+        """Get ready for `workers` concurrent requests; nothing to do by default."""
+
+
+class PollyBackend(Backend):
+    name = 'polly'
+
+    def __init__(self, client=None):
+        """`client` replaces the process-wide one from audiogen.clients (e.g. a stand-in)."""
+        self._client = client
+        self.pooled = None
+
+    def reserve(self, workers):
+        from audiogen import clients
+        if self._client is None:
+            self.pooled = clients.shared(workers)
+        elif self.pooled is None or self.pooled.size < clients.size_for(workers):
+            self.pooled = clients.Pooled(self._client, clients.size_for(workers))
+        return self.pooled
+
+    @property
+    def client(self):
+        return (self.pooled or self.reserve(WORKERS)).client
+
+    def synthesize(self, ssml, voice, engine):
+        return self.request(ssml, voice, engine)[0]
+
+    def request(self, ssml, voice, engine):
+        pooled = self.pooled or self.reserve(WORKERS)
+        # The slot covers reading the body too: the connection is busy until the stream is drained.
+        with pooled.slot() as wait:
+            start = time.perf_counter()
+            r = pooled.client.synthesize_speech(Text=ssml, TextType='ssml', OutputFormat='mp3', VoiceId=voice,
+                                                Engine=engine)
+            first = r['AudioStream'].read(4096)
+            ttfb = time.perf_counter() - start
+            audio = first + r['AudioStream'].read()
+        return audio, {
+            'chars': r.get('RequestCharacters'), 'ttfb': ttfb, 'pool_wait': wait,
+            'retries': r.get('ResponseMetadata', {}).get('RetryAttempts', 0),
+        }
+
+
+class TaskBackend(Backend):
+    name = 'tasks'
+
+    def __init__(self, batch=None):
+        self._batch = batch
+
+    @property
+    def batch(self):
+        if self._batch is None:
+            from audiogen import clients, polly
+            from audiogen.polly_tasks import TaskBatch
+            self._batch = TaskBatch(polly.home_client(clients.shared().client), polly.s3)
+        return self._batch
+
+    def prepare(self, tracks):
+        from audiogen.polly_tasks import whole
+        return [whole(t) for t in tracks]
+
+    def synthesize(self, ssml, voice, engine):
+        return self.batch.synthesize(ssml, voice, engine)
+
+
+class DraftBackend(Backend):
+    name = 'draft'
+    out_dir = DRAFT_DIR
+
+    def synthesize(self, text, voice, engine):
+        per_word, break_scale, _ = durations.coefficients_for(voice, engine)
+        chunks, elapsed, frames = [], 0.0, 0
+        for seg in ssml.segments(text):
+            if isinstance(seg, ssml.Break):
+                elapsed += seg.seconds * break_scale
+                frame = SILENT_FRAME
+            else:
+                elapsed += seg.words * per_word / seg.rate
+                frame = TONE_FRAME
+            n = round(elapsed / FRAME_SECONDS) - frames
+            chunks.append(frame * n)
+            frames += n
+        return b''.join(chunks)
+
+
+BACKENDS = {b.name: b for b in (PollyBackend, TaskBackend, DraftBackend)}
+
+
+def get(name=None):
+    """A backend instance by name (default: $DRIFTLAB_BACKEND, else polly)."""
+    name = name or os.environ.get('DRIFTLAB_BACKEND', 'polly')
+    if name not in BACKENDS:
+        raise ValueError(f"unknown backend {name!r} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
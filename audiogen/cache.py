@@ -0,0 +1,50 @@
+"""
+Synthesized-part cache, keyed by everything that determines the audio:
+backend, voice, engine and the exact SSML. A rebuild only goes to Polly for
+parts whose text actually changed.
+
+Entries are plain MP3 files under CACHE_DIR; delete the directory to clear it.
+"""
+import hashlib
+import os
+import shutil
+
+CACHE_DIR = './.driftlab/parts'
+
+
+def part_key(ssml, voice, engine, backend):
+    return hashlib.sha256('\0'.join((backend, voice, engine, ssml)).encode()).hexdigest()
+
+
+def _place(src, dst):
+    """Hard-link `src` to `dst` (copy across filesystems), replacing `dst`."""
+    tmp = dst + '.tmp'
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+class PartCache:
+    def __init__(self, root=CACHE_DIR):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.root, key[:2], key + '.mp3')
+
+    def get(self, key, dst):
+        """Materialize the cached part at `dst`; False on a miss."""
+        src = self.path(key)
+        if not os.path.exists(src):
+            return False
+        _place(src, dst)
+        return True
+
+    def put(self, key, src):
+        dst = self.path(key)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        _place(src, dst)
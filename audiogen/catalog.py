@@ -0,0 +1,123 @@
+"""
+Track registry.
+Script text lives in scripts/<slug>.ssml (one <speak> document per part) and
+scripts/index.json lists every track with its voice, engine and the
+generate_*.py group it belongs to. Only the index is read up front; a track's
+SSML is read the first time its parts are needed.
+
+    python3 -m audiogen.catalog [--check] [slug ...]   (list, or validate the SSML)
+"""
+import argparse
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from xml.etree import ElementTree
+
+OUTPUT_DIR = './driftlab-audio'
+SCRIPTS_DIR = './scripts'
+INDEX = os.path.join(SCRIPTS_DIR, 'index.json')
+
+# Polly's SynthesizeSpeech limits per request.
+MAX_BILLED_CHARS = 3000
+MAX_TOTAL_CHARS = 6000
+
+SPEAK = re.compile(r'<speak>.*?</speak>', re.S)
+
+TRACKS = {}
+
+
+def script_path(slug):
+    return os.path.join(SCRIPTS_DIR, f"{slug}.ssml")
+
+
+def read_parts(path):
+    with open(path, encoding='utf-8') as f: return SPEAK.findall(f.read())
+
+
+@dataclass
+class Track:
+    name: str
+    slug: str
+    voice: str = 'Ruth'
+    engine: str = 'long-form'
+    group: str = None
+    text: list = field(default=None, repr=False)
+
+    @property
+    def parts(self):
+        if self.text is None:
+            self.text = read_parts(script_path(self.slug))
+        return self.text
+
+    @property
+    def filename(self):
+        return f"{self.slug}.mp3"
+
+
+def register(name, slug, parts=None, voice='Ruth', engine='long-form', group=None):
+    """Add a track; without `parts` its script is read from SCRIPTS_DIR when first needed."""
+    track = Track(name, slug, voice, engine, group, parts)
+    TRACKS[slug] = track
+    return track
+
+
+def reload(index=INDEX):
+    """Re-read the index (after an edit) and return all tracks; scripts are re-read lazily."""
+    TRACKS.clear()
+    with open(index, encoding='utf-8') as f:
+        for e in json.load(f):
+            register(e['name'], e['slug'], None, e.get('voice', 'Ruth'), e.get('engine', 'long-form'), e.get('group'))
+    return list(TRACKS.values())
+
+
+def load(slugs=None, group=None):
+    """The requested tracks (all by default, or one generate_*.py group)."""
+    if not TRACKS:
+        reload()
+    if group:
+        return [t for t in TRACKS.values() if t.group == group]
+    if not slugs:
+        return list(TRACKS.values())
+    unknown = [s for s in slugs if s not in TRACKS]
+    if unknown:
+        raise KeyError(f"unknown track(s): {', '.join(unknown)}")
+    return [TRACKS[s] for s in slugs]
+
+
+def check(track):
+    """Problems with a track's script: missing file, malformed SSML, parts over Polly's limits."""
+    from audiogen.scheduler import billed_chars
+    path, from_file = script_path(track.slug), track.text is None
+    if from_file and not os.path.exists(path):
+        return [f"{path} is missing"]
+    problems = [] if track.parts else ["no <speak> parts"]
+    if from_file:
+        with open(path, encoding='utf-8') as f: opened = f.read().count('<speak>')
+        if opened != len(track.parts):
+            problems.append(f"{opened} <speak> tags but {len(track.parts)} complete parts")
+    for i, part in enumerate(track.parts, 1):
+        try:
+            ElementTree.fromstring(part)
+        except ElementTree.ParseError as e:
+            problems.append(f"part {i}: {e}")
+        if billed_chars(part) > MAX_BILLED_CHARS or len(part) > MAX_TOTAL_CHARS:
+            problems.append(f"part {i}: {billed_chars(part)} billed / {len(part)} total chars is over Polly's limit")
+    return problems
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='List the registered tracks, or validate their scripts.')
+    ap.add_argument('slugs', nargs='*')
+    ap.add_argument('--check', action='store_true')
+    args = ap.parse_args()
+
+    bad = 0
+    for t in load(args.slugs):
+        if not args.check:
+            print(f"  {t.slug:<28} {t.voice:<9} {t.engine:<10} {t.group or '-':<24} {t.name}")
+            continue
+        problems = check(t)
+        bad += bool(problems)
+        print(f"  {t.slug:<28} {len(t.parts):>2} parts  {'; '.join(problems) or 'ok'}")
+    raise SystemExit(1 if bad else 0)
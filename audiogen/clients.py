@@ -0,0 +1,74 @@
+"""
+Process-wide synthesis client.
+
+Every Polly request in a process goes through one client whose HTTP
+connection pool holds at least CONNECTIONS keep-alive connections
+(DRIFTLAB_POOL_CONNECTIONS, botocore's default of 10 otherwise) and one per
+synthesis worker, grown on demand and never shrunk. It is kept for the life
+of the process, so connections and TLS sessions carry over from track to
+track and build to build. A request first takes one of the pool's slots,
+one per connection; urllib3 would open and then throw away an extra
+connection instead. When anything else shares the client (task polling, a
+second build in the process), requests queue for a slot. The time spent
+waiting is the pool-wait metric, in each request's ledger row and as a
+'pool-wait' trace span.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from audiogen import trace
+
+CONNECTIONS = int(os.environ.get('DRIFTLAB_POOL_CONNECTIONS', 10))
+
+_lock = threading.Lock()
+_shared = None
+
+
+class Pooled:
+    def __init__(self, client, size):
+        self.client, self.size = client, size
+        self.slots = threading.BoundedSemaphore(size)
+        self.lock = threading.Lock()
+        self.requests, self.waited, self.max_wait = 0, 0.0, 0.0
+
+    @contextmanager
+    def slot(self):
+        """Hold one connection's worth of concurrency; yields the seconds spent waiting for it."""
+        start = time.perf_counter()
+        with trace.span('pool-wait'):
+            self.slots.acquire()
+        wait = time.perf_counter() - start
+        with self.lock:
+            self.requests += 1
+            self.waited += wait
+            self.max_wait = max(self.max_wait, wait)
+        try:
+            yield wait
+        finally:
+            self.slots.release()
+
+    def stats(self):
+        with self.lock:
+            return {'size': self.size, 'requests': self.requests, 'wait_total': self.waited, 'wait_max': self.max_wait}
+
+
+def size_for(workers):
+    return max(CONNECTIONS, workers or 0)
+
+
+def shared(workers=0, make=None):
+    """The process's Pooled synthesis client, rebuilt larger if `workers` outgrows it.
+
+    `make(size)` builds the underlying client; default audiogen.polly.synthesis_client.
+    """
+    global _shared
+    size = size_for(workers)
+    with _lock:
+        if _shared is None or _shared.size < size:
+            if make is None:
+                from audiogen import polly
+                make = polly.synthesis_client
+            _shared = Pooled(make(size), size)
+        return _shared
@@ -0,0 +1,111 @@
+"""
+PCM decoding through ffmpeg, streamed in fixed-size blocks so long tracks are
+analysed in bounded memory.
+
+A finished track is decoded once, by to_pcm(), into a raw float32 file (the
+PCM intermediate) that every later step maps instead of decoding the MP3
+again: pcm() is the whole track as one read-only array and blocks() hands
+out views of it, dropping pages already read from the process as it goes,
+so any number of passes over a long story share one decode and stay small.
+The pipeline removes a track's intermediate when its post steps finish, and
+clear_stale() drops any left behind by a worker that was killed mid-track.
+Needs: pip3 install numpy, and ffmpeg on PATH.
+"""
+import mmap
+import os
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+SAMPLE_RATE = 24000
+BLOCK_SECONDS = 30
+PCM_DIR = os.environ.get('DRIFTLAB_PCM_DIR', './.driftlab/pcm')
+PCM_EXT = '.f32'
+# Older than any track's post steps take; newer files may belong to a build still running.
+STALE_SECONDS = 3600
+
+
+def _command(path, sample_rate):
+    return ['ffmpeg', '-v', 'error', '-nostdin', '-i', path, '-f', 'f32le', '-ac', '1', '-ar', str(sample_rate)]
+
+
+def to_pcm(path, sample_rate=SAMPLE_RATE, pcm_dir=PCM_DIR):
+    """Decode `path` to a mono float32 intermediate in `pcm_dir`; returns its path."""
+    os.makedirs(pcm_dir, exist_ok=True)
+    # A fresh name every time: two assemblies of one track must not share (or delete) each other's file.
+    fd, out = tempfile.mkstemp(dir=pcm_dir, suffix=PCM_EXT)
+    os.close(fd)
+    p = subprocess.run(_command(path, sample_rate) + ['-y', out], stdin=subprocess.DEVNULL, capture_output=True)
+    if p.returncode:
+        os.remove(out)
+        raise RuntimeError(f"ffmpeg could not decode {path}: {p.stderr.decode(errors='replace').strip()}")
+    return out
+
+
+def _map(path):
+    with open(path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            return None, np.zeros(0, np.float32)
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return m, np.frombuffer(m, '<f4')
+
+
+def pcm(path):
+    """A PCM intermediate as one read-only float32 array backed by the file (no copy)."""
+    return _map(path)[1]
+
+
+def remove(path):
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+def clear_stale(pcm_dir=PCM_DIR, age=STALE_SECONDS):
+    """Remove intermediates in `pcm_dir` not written to for `age` seconds; returns how many."""
+    if not os.path.isdir(pcm_dir):
+        return 0
+    cutoff, n = time.time() - age, 0
+    for name in os.listdir(pcm_dir):
+        fp = os.path.join(pcm_dir, name)
+        try:
+            if name.endswith(PCM_EXT) and os.path.getmtime(fp) < cutoff:
+                os.remove(fp)
+                n += 1
+        except FileNotFoundError:
+            pass  # removed by its own build meanwhile
+    return n
+
+
+def _mapped(path, size):
+    m, samples = _map(path)
+    dropped = 0
+    for start in range(0, len(samples), size):
+        yield start, samples[start:start + size]
+        # Pages of blocks already handed out come from the file again if a caller still touches them.
+        end = (start + size) * 4 // mmap.PAGESIZE * mmap.PAGESIZE
+        if hasattr(mmap, 'MADV_DONTNEED') and end > dropped:
+            end = min(end, len(m))
+            m.madvise(mmap.MADV_DONTNEED, dropped, end - dropped)
+            dropped = end
+
+
+def blocks(path, sample_rate=SAMPLE_RATE, block_seconds=BLOCK_SECONDS):
+    """Yield (first sample index, mono float32 block) for the whole file.
+
+    `path` may be an MP3 (decoded as it streams) or a PCM intermediate from
+    to_pcm() at `sample_rate` (mapped in place).
+    """
+    size, start = int(sample_rate * block_seconds), 0
+    if path.endswith(PCM_EXT):
+        yield from _mapped(path, size)
+        return
+    with subprocess.Popen(_command(path, sample_rate) + ['-'], stdout=subprocess.PIPE, stderr=subprocess.PIPE) as p:
+        while chunk := p.stdout.read(size * 4):
+            block = np.frombuffer(chunk, '<f4')
+            yield start, block
+            start += len(block)
+        err = p.stderr.read().decode(errors='replace').strip()
+    if p.returncode:
+        raise RuntimeError(f"ffmpeg could not decode {path}: {err}")
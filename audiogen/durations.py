@@ -0,0 +1,161 @@
+"""
+Track duration model.
+Predicts audio length from SSML alone, before any Polly call:
+
+    seconds = a * sum(words / prosody rate) + b * sum(<break> times) + c * parts
+
+(a, b, c) are fitted per voice/engine from tracks that have actually been
+built, ridge-regressed toward DEFAULT so a voice with only a couple of tracks
+still gets sane numbers. audiogen/durations.json holds the committed
+coefficients; a refit (--fit, or after every build) goes to
+.driftlab/durations.json, which takes precedence once it exists.
+
+    python3 -m audiogen.durations [--fit] [--json] [slug ...]
+"""
+import argparse
+import json
+import os
+import time
+
+from audiogen import mp3, ssml
+from audiogen.catalog import OUTPUT_DIR, load
+
+MODEL_FILE = os.path.join(os.path.dirname(__file__), 'durations.json')
+FITTED_FILE = './.driftlab/durations.json'
+BUNDLED_DIR = './assets/audio'
+
+# Seconds per rate-adjusted word, break scale, padding per synthesized part.
+DEFAULT = (0.4, 1.0, 0.5)
+# How many tracks' worth of weight the prior gets in a fit.
+PRIOR_WEIGHT = 2.0
+POOLED = '*'
+
+_coefficients = None
+
+
+def key(voice, engine):
+    return f"{voice}/{engine}"
+
+
+def features(parts):
+    units = pauses = 0.0
+    for part in parts:
+        for seg in ssml.segments(part):
+            if isinstance(seg, ssml.Break):
+                pauses += seg.seconds
+            else:
+                units += seg.words / seg.rate
+    return units, pauses, float(len(parts))
+
+
+def coefficients():
+    global _coefficients
+    if _coefficients is None:
+        path = FITTED_FILE if os.path.exists(FITTED_FILE) else MODEL_FILE
+        try:
+            with open(path) as f: _coefficients = {k: tuple(v) for k, v in json.load(f).items()}
+        except OSError:
+            _coefficients = {}
+    return _coefficients
+
+
+def coefficients_for(voice, engine):
+    c = coefficients()
+    return c.get(key(voice, engine)) or c.get(POOLED) or DEFAULT
+
+
+def predict(parts, voice, engine):
+    a, b, pad = coefficients_for(voice, engine)
+    units, pauses, n = features(parts)
+    return max(0.0, a * units + b * pauses + pad * n)
+
+
+def predict_track(track):
+    return predict(track.parts, track.voice, track.engine)
+
+
+def predict_speech(parts, voice, engine):
+    """predict() without the per-part term. Fitted on scripts of one to four parts, that term acts as an
+    intercept (it can come out negative), so a track split into many more parts needs it left out."""
+    a, b, _ = coefficients_for(voice, engine)
+    units, pauses, _ = features(parts)
+    return a * units + b * pauses
+
+
+def measured(track, dirs=(OUTPUT_DIR, BUNDLED_DIR)):
+    """Actual duration of the first built copy of `track`, or None."""
+    for d in dirs:
+        path = os.path.join(d, track.filename)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return mp3.duration(mp3.audio_frames(f.read()))
+    return None
+
+
+def _solve(a, y):
+    """Gaussian elimination for a small dense system."""
+    n = len(y)
+    m = [row[:] + [y[i]] for i, row in enumerate(a)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(m[r][col]))
+        m[col], m[pivot] = m[pivot], m[col]
+        for r in range(n):
+            if r != col and m[col][col]:
+                k = m[r][col] / m[col][col]
+                m[r] = [x - k * p for x, p in zip(m[r], m[col])]
+    return tuple(m[i][n] / m[i][i] if m[i][i] else 0.0 for i in range(n))
+
+
+def fit(samples, prior=DEFAULT, weight=PRIOR_WEIGHT):
+    """Ridge fit of (a, b, pad) to [(features, seconds)], shrunk toward `prior`."""
+    k = len(prior)
+    xtx = [[sum(x[i] * x[j] for x, _ in samples) for j in range(k)] for i in range(k)]
+    xty = [sum(x[i] * y for x, y in samples) for i in range(k)]
+    for i in range(k):
+        lam = weight * (xtx[i][i] / len(samples) if samples else 1.0) or weight
+        xtx[i][i] += lam
+        xty[i] += lam * prior[i]
+    return _solve(xtx, xty)
+
+
+def calibrate(tracks, dirs=(OUTPUT_DIR, BUNDLED_DIR), path=FITTED_FILE):
+    """Fit coefficients per voice/engine (plus a pooled fallback) from built tracks and save them."""
+    global _coefficients
+    groups = {}
+    for t in tracks:
+        seconds = measured(t, dirs)
+        if seconds:
+            groups.setdefault(key(t.voice, t.engine), []).append((features(t.parts), seconds))
+    pooled = fit([s for g in groups.values() for s in g])
+    model = {POOLED: pooled, **{k: fit(g, prior=pooled) for k, g in sorted(groups.items())}}
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write('{\n' + ',\n'.join(f'  "{k}": {[round(v, 5) for v in c]}' for k, c in model.items()) + '\n}\n')
+    _coefficients = model
+    return model, sum(len(g) for g in groups.values())
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Predict track durations from SSML.')
+    ap.add_argument('slugs', nargs='*')
+    ap.add_argument('--fit', action='store_true', help='refit coefficients from built tracks first')
+    ap.add_argument('--json', action='store_true', help='print {filename: seconds} for manifest drafts')
+    args = ap.parse_args()
+
+    tracks = load(args.slugs)
+    if args.fit:
+        model, n = calibrate(load())
+        print(f"Fitted {len(model) - 1} voice/engine pair(s) from {n} built tracks -> {FITTED_FILE}")
+    start = time.perf_counter()
+    predicted = {t.filename: predict_track(t) for t in tracks}
+    elapsed = time.perf_counter() - start
+    if args.json:
+        print(json.dumps({k: round(v) for k, v in predicted.items()}, indent=2))
+    else:
+        for t in tracks:
+            actual = measured(t)
+            err = f"{predicted[t.filename] - actual:+5.0f}s" if actual else ''
+            print(f"  {t.slug:<28} {t.voice}/{t.engine:<10} {predicted[t.filename]:>6.0f}s "
+                  f"{f'{actual:.0f}s' if actual else '-':>6} {err}")
+        print(f"\n{len(tracks)} tracks predicted in {elapsed * 1000:.1f} ms")
@@ -0,0 +1,120 @@
+"""
+Waveform sidecars: multi-resolution peak/RMS envelopes for the app's visualizers,
+written next to each track as <slug>.wave so the phone never has to decode
+audio to draw it.
+
+Format (little-endian):
+    header  b'DLWF', version u8, levels u8, factor u16, sample_rate u32,
+            samples per level-0 bin u32, floor dB i16, pad u16
+    levels  for each: bin count u32, then count (peak u8, rms u8) pairs
+
+Level 0 bins are BIN_SECONDS long, each following level merges FACTOR bins,
+down to a handful of bins for the whole track. Values are dBFS mapped
+linearly from FLOOR_DB..0 onto 0..255.
+
+    python3 -m audiogen.envelope [slug ...] [--dir DIR]   (sidecars for built tracks)
+"""
+import argparse
+import os
+import struct
+
+import numpy as np
+
+MAGIC, VERSION = b'DLWF', 1
+HEADER = struct.Struct('<4sBBHIIhH')
+BIN_SECONDS = 0.1
+FACTOR = 4
+MIN_BINS = 64
+FLOOR_DB = -60
+
+
+def sidecar_path(path):
+    return os.path.splitext(path)[0] + '.wave'
+
+
+def quantize(x):
+    db = 20 * np.log10(np.maximum(x, 1e-12))
+    return np.clip(np.rint((db - FLOOR_DB) * (255 / -FLOOR_DB)), 0, 255).astype(np.uint8)
+
+
+class Envelope:
+    """Analyzer: per-bin peak and mean square at level 0, coarser levels derived at the end."""
+
+    def __init__(self, sample_rate):
+        self.rate = sample_rate
+        self.bin = int(sample_rate * BIN_SECONDS)
+        self.carry = np.empty(0, np.float32)
+        self.peaks, self.power = [], []
+
+    def feed(self, start, block):
+        x = np.concatenate((self.carry, block)) if len(self.carry) else block
+        n = len(x) // self.bin * self.bin
+        w = x[:n].reshape(-1, self.bin)
+        self.carry = x[n:]
+        self.peaks.append(np.abs(w).max(axis=1, initial=0.0))
+        self.power.append(np.mean(w * w, axis=1, dtype=np.float64))
+
+    def levels(self):
+        """[(peak, mean square)] arrays, finest first."""
+        peaks, power = list(self.peaks), list(self.power)
+        if len(self.carry):
+            peaks.append(np.abs(self.carry).max(keepdims=True))
+            power.append(np.mean(self.carry * self.carry, keepdims=True, dtype=np.float64))
+        peak = np.concatenate(peaks) if peaks else np.empty(0)
+        power = np.concatenate(power) if power else np.empty(0)
+        out = [(peak, power)]
+        while len(peak) > MIN_BINS:
+            pad = -len(peak) % FACTOR
+            # Padded bins repeat the last value so the tail bin is not dragged toward silence.
+            peak = np.pad(peak, (0, pad), mode='edge').reshape(-1, FACTOR).max(axis=1)
+            power = np.pad(power, (0, pad), mode='edge').reshape(-1, FACTOR).mean(axis=1)
+            out.append((peak, power))
+        return out
+
+    def encode(self):
+        levels = self.levels()
+        chunks = [HEADER.pack(MAGIC, VERSION, len(levels), FACTOR, self.rate, self.bin, FLOOR_DB, 0)]
+        for peak, power in levels:
+            pairs = np.stack((quantize(peak), quantize(np.sqrt(power))), axis=1)
+            chunks += [struct.pack('<I', len(pairs)), pairs.tobytes()]
+        return b''.join(chunks)
+
+    def report(self, track, info):
+        out = sidecar_path(info['path'])
+        with open(out + '.tmp', 'wb') as f: f.write(self.encode())
+        os.replace(out + '.tmp', out)
+        return {'envelope': out}
+
+
+def read(path):
+    """Header fields and, under 'levels', (peak dB, rms dB) arrays per level, finest first."""
+    with open(path, 'rb') as f: buf = f.read()
+    magic, version, count, factor, rate, bin_samples, floor, _ = HEADER.unpack_from(buf)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: not a v{VERSION} waveform sidecar")
+    off, levels = HEADER.size, []
+    for _ in range(count):
+        n, = struct.unpack_from('<I', buf, off)
+        pairs = np.frombuffer(buf, np.uint8, n * 2, off + 4).reshape(-1, 2)
+        levels.append(pairs * (-floor / 255) + floor)
+        off += 4 + n * 2
+    return {'factor': factor, 'sample_rate': rate, 'bin_seconds': bin_samples / rate, 'levels': levels}
+
+
+if __name__ == '__main__':
+    from audiogen import decode
+    from audiogen.catalog import OUTPUT_DIR, load
+    ap = argparse.ArgumentParser(description='Write waveform sidecars for already-built tracks.')
+    ap.add_argument('slugs', nargs='*')
+    ap.add_argument('--dir', default=OUTPUT_DIR)
+    args = ap.parse_args()
+
+    for track in load(args.slugs):
+        path = os.path.join(args.dir, track.filename)
+        if not os.path.exists(path):
+            continue
+        env = Envelope(decode.SAMPLE_RATE)
+        for start, block in decode.blocks(path):
+            env.feed(start, block)
+        out = env.report(track, {'path': path})['envelope']
+        print(f"  {os.path.basename(out):<34} {os.path.getsize(out)/1024:5.1f} KB  {len(env.levels())} levels")
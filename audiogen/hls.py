@@ -0,0 +1,159 @@
+"""
+Content-addressed HLS packaging: a finished track becomes a VOD playlist of
+MP3 segments named by the hash of their bytes, so republishing a track after
+an edit only adds the segments around the edit; every other segment keeps
+its name and stays cached on the phone and at the CDN.
+
+Segments are cut where the script already pauses: at the part seams from
+build() and in the middle of every break of at least PARAGRAPH_BREAK seconds
+that pacing analysis found (audiogen.pacing), merged so none is shorter than
+MIN_SEGMENT. An edit inside a paragraph moves no boundary outside it. A
+segment's first frames may borrow from the bit reservoir of the segment
+before; those are muted through global_gain, as preview clips do (they sit
+in a pause), so every segment decodes on its own.
+
+A segment's bytes must not depend on where it sits in the track, so each one
+carries a zero timestamp (the ID3 PRIV tag HLS packed audio requires) and the
+playlist puts an EXT-X-DISCONTINUITY between segments. On republish only the
+playlist changes in place; segments are immutable.
+
+Layout, next to the track: hls/<slug>.m3u8 and hls/segments/<sha256>.mp3,
+the segment store shared by every track.
+
+    python3 -m audiogen.hls [slug ...] [--dir DIR]   (package already-built tracks)
+"""
+import argparse
+import hashlib
+import math
+import os
+import struct
+
+from audiogen import mp3
+from audiogen.preview import attenuate
+
+PARAGRAPH_BREAK = 2.0
+MIN_SEGMENT = 4.0
+HASH_CHARS = 32
+
+PRIV_OWNER = b'com.apple.streaming.transportStreamTimestamp\0'
+
+
+def _syncsafe(n):
+    return bytes((n >> s) & 0x7F for s in (21, 14, 7, 0))
+
+
+def timestamp_tag(ts=0):
+    """ID3v2.4 tag with the packed-audio PRIV timestamp (90 kHz clock)."""
+    body = PRIV_OWNER + struct.pack('>Q', ts & (1 << 33) - 1)
+    frame = b'PRIV' + _syncsafe(len(body)) + b'\0\0' + body
+    return b'ID3\x04\0\0' + _syncsafe(len(frame)) + frame
+
+
+TAG = timestamp_tag()
+
+
+def cut_times(info):
+    """Seconds where the script pauses: part seams and the middle of long matched breaks."""
+    times = list(info.get('seams') or [])
+    for part in (info.get('pacing') or {}).get('parts', []):
+        for b in part['detail']:
+            if b['got'] is not None and b['got'] >= PARAGRAPH_BREAK:
+                times.append(b['at'] + b['got'] / 2)
+    return sorted(times)
+
+
+def boundaries(buf, frames, times):
+    """Frame indices where segments start (always including 0)."""
+    starts, t = [], 0.0
+    for _, f in frames:
+        starts.append(t)
+        t += f.samples / f.sample_rate
+    cuts, i = [0], 0
+    for at in times:
+        while i < len(frames) and starts[i] < at:
+            i += 1
+        if i < len(frames) and starts[i] - starts[cuts[-1]] >= MIN_SEGMENT:
+            cuts.append(i)
+    if len(cuts) > 1 and t - starts[cuts[-1]] < MIN_SEGMENT:
+        cuts.pop()
+    return cuts
+
+
+def segment(buf, frames, times):
+    """[(bytes, seconds)] for every segment of the track."""
+    cuts = boundaries(buf, frames, times) + [len(frames)]
+    out = []
+    for a, b in zip(cuts, cuts[1:]):
+        run, data, reservoir = frames[a:b], bytearray(TAG), 0
+        for off, f in run:
+            frame = buf[off:off + f.size]
+            if mp3.main_data_begin(buf, off, f) > reservoir:
+                frame = bytearray(frame)
+                attenuate(frame, f, 255)
+            data += frame
+            reservoir += f.size - 4 - (2 if f.crc else 0) - mp3.side_info(f)
+        out.append((bytes(data), mp3.duration(run)))
+    return out
+
+
+def playlist(entries):
+    """VOD playlist for [(segment uri, seconds)]."""
+    lines = ['#EXTM3U', '#EXT-X-VERSION:3', '#EXT-X-PLAYLIST-TYPE:VOD',
+             f"#EXT-X-TARGETDURATION:{math.ceil(max((s for _, s in entries), default=0))}", '#EXT-X-MEDIA-SEQUENCE:0']
+    for i, (uri, seconds) in enumerate(entries):
+        if i:
+            lines.append('#EXT-X-DISCONTINUITY')
+        lines += [f"#EXTINF:{seconds:.3f},", uri]
+    return '\n'.join(lines + ['#EXT-X-ENDLIST', ''])
+
+
+def package(path, info, out_dir=None):
+    """Write the playlist and any segments not already in the store; returns (playlist, all, new) names."""
+    out_dir = out_dir or os.path.join(os.path.dirname(path), 'hls')
+    store = os.path.join(out_dir, 'segments')
+    os.makedirs(store, exist_ok=True)
+    with open(path, 'rb') as f: buf = f.read()
+    entries, names, new = [], [], []
+    for data, seconds in segment(buf, mp3.audio_frames(buf), cut_times(info)):
+        name = f"{hashlib.sha256(data).hexdigest()[:HASH_CHARS]}.mp3"
+        seg = os.path.join(store, name)
+        if not os.path.exists(seg):
+            with open(seg + '.tmp', 'wb') as f: f.write(data)
+            os.replace(seg + '.tmp', seg)
+            new.append(name)
+        entries.append((f"segments/{name}", seconds))
+        names.append(name)
+    out = os.path.join(out_dir, os.path.splitext(os.path.basename(path))[0] + '.m3u8')
+    with open(out + '.tmp', 'w') as f: f.write(playlist(entries))
+    os.replace(out + '.tmp', out)
+    return out, names, new
+
+
+def step(track, path, info):
+    """Pipeline post step; runs after analysis so paragraph breaks are known."""
+    out, names, new = package(path, info)
+    return {'hls': out, 'hls_segments': names, 'hls_new': new}
+
+
+if __name__ == '__main__':
+    from audiogen import analysis, decode
+    from audiogen.catalog import OUTPUT_DIR, load
+    from audiogen.pacing import Pacing, read_seams
+    ap = argparse.ArgumentParser(description='Package built tracks as content-addressed HLS.')
+    ap.add_argument('slugs', nargs='*')
+    ap.add_argument('--dir', default=OUTPUT_DIR)
+    args = ap.parse_args()
+
+    for track in load(args.slugs):
+        path = os.path.join(args.dir, track.filename)
+        if not os.path.exists(path):
+            continue
+        # The same cut points as the build step, so unchanged segments keep their names.
+        info = {'seams': read_seams(path)}
+        if analysis.available():
+            pacing = Pacing(decode.SAMPLE_RATE)
+            for start, block in decode.blocks(path):
+                pacing.feed(start, block)
+            info = pacing.report(track, info)
+        out, names, new = package(path, info)
+        print(f"  {track.slug:<28} {len(names):>3} segments, {len(new):>3} new  {out}")
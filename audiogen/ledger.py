@@ -0,0 +1,121 @@
+"""
+Synthesis ledger: one SQLite row per backend request, kept across builds.
+
+    python3 -m audiogen.ledger [--days 30] [--period day|week|month]
+
+prints latency percentiles, connection-pool wait and throughput by engine per
+period, and per build how much of the configured concurrency was actually used.
+"""
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+
+LEDGER = os.environ.get('DRIFTLAB_LEDGER', './.driftlab/ledger.db')
+
+COLUMNS = ('ts', 'build', 'workers', 'backend', 'engine', 'voice', 'track', 'part',
+           'chars', 'latency', 'ttfb', 'bytes', 'retries', 'pool_wait', 'ok')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    ts REAL, build TEXT, workers INTEGER, backend TEXT, engine TEXT, voice TEXT,
+    track TEXT, part INTEGER, chars INTEGER, latency REAL, ttfb REAL,
+    bytes INTEGER, retries INTEGER, pool_wait REAL, ok INTEGER
+);
+CREATE INDEX IF NOT EXISTS requests_ts ON requests (ts);
+"""
+
+PERIODS = {'day': '%Y-%m-%d', 'week': '%Y-W%W', 'month': '%Y-%m'}
+
+
+class Ledger:
+    def __init__(self, path=LEDGER):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+        # Ledgers from before pool_wait was recorded.
+        if 'pool_wait' not in {r[1] for r in self.db.execute("PRAGMA table_info(requests)")}:
+            with self.db:
+                self.db.execute("ALTER TABLE requests ADD COLUMN pool_wait REAL")
+        self.lock = threading.Lock()
+
+    def record(self, **row):
+        row.setdefault('ts', time.time())
+        with self.lock, self.db:
+            self.db.execute(f"INSERT INTO requests ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                            [row.get(c) for c in COLUMNS])
+
+    def rows(self, since=0.0):
+        cur = self.db.execute(f"SELECT {', '.join(COLUMNS)} FROM requests WHERE ts >= ? ORDER BY ts", (since,))
+        return [dict(zip(COLUMNS, r)) for r in cur]
+
+    def close(self):
+        self.db.close()
+
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def by_engine(rows, period='day'):
+    """{(period, backend, engine): summary} over successful requests."""
+    groups = defaultdict(list)
+    for r in rows:
+        if r['ok']:
+            groups[(time.strftime(PERIODS[period], time.localtime(r['ts'])), r['backend'], r['engine'])].append(r)
+    out = {}
+    for key, rs in sorted(groups.items()):
+        lat = [r['latency'] for r in rs]
+        out[key] = {
+            'requests': len(rs),
+            'p50': percentile(lat, 50), 'p95': percentile(lat, 95), 'p99': percentile(lat, 99),
+            'ttfb_p50': percentile([r['ttfb'] for r in rs if r['ttfb'] is not None], 50),
+            'wait_p95': percentile([r['pool_wait'] for r in rs if r['pool_wait'] is not None], 95),
+            'chars_per_s': sum(r['chars'] or 0 for r in rs) / (sum(lat) or 1),
+            'retries': sum(r['retries'] or 0 for r in rs),
+        }
+    return out
+
+
+def by_build(rows):
+    """{build: summary}: wall time, throughput and how many requests were really in flight."""
+    groups = defaultdict(list)
+    for r in rows:
+        groups[r['build']].append(r)
+    out = {}
+    for build, rs in groups.items():
+        wall = max(r['ts'] for r in rs) - min(r['ts'] - r['latency'] for r in rs)
+        out[build] = {
+            'requests': len(rs), 'failed': sum(not r['ok'] for r in rs),
+            'workers': rs[0]['workers'], 'wall': wall,
+            'chars_per_s': sum(r['chars'] or 0 for r in rs) / (wall or 1),
+            'in_flight': sum(r['latency'] for r in rs) / (wall or 1),
+        }
+    return out
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Report synthesis latency and throughput from the ledger.')
+    ap.add_argument('--days', type=float, default=30)
+    ap.add_argument('--period', choices=PERIODS, default='day')
+    ap.add_argument('--ledger', default=LEDGER)
+    args = ap.parse_args()
+
+    rows = Ledger(args.ledger).rows(time.time() - args.days * 86400)
+    print(f"\n{'period':<11} {'backend':<7} {'engine':<9} {'reqs':>5} {'p50':>6} {'p95':>6} {'p99':>6} {'ttfb50':>6} {'wait95':>6} {'chars/s':>8} {'retries':>7}")
+    for (period, backend, engine), s in by_engine(rows, args.period).items():
+        print(f"{period:<11} {backend:<7} {engine:<9} {s['requests']:>5} {s['p50']:>6.2f} {s['p95']:>6.2f} "
+              f"{s['p99']:>6.2f} {s['ttfb_p50']:>6.2f} {s['wait_p95']:>6.2f} {s['chars_per_s']:>8.0f} {s['retries']:>7}")
+    print(f"\n{'build':<22} {'reqs':>5} {'failed':>6} {'workers':>7} {'in flight':>9} {'wall s':>7} {'chars/s':>8}")
+    for build, s in by_build(rows).items():
+        print(f"{build:<22} {s['requests']:>5} {s['failed']:>6} {s['workers'] or 0:>7} {s['in_flight']:>9.1f} "
+              f"{s['wall']:>7.0f} {s['chars_per_s']:>8.0f}")
@@ -0,0 +1,87 @@
+"""
+Voice x engine matrix builds for narrator A/B tests.
+
+Every chosen track is rendered once per voice/engine combination in a single
+pipeline run, so all variants share the worker pool, the part cache and the
+post steps; a variant that matches a track's normal voice comes straight from
+the cache. Output goes to <out>/variants/<slug>--<voice>-<engine>.mp3, with
+one manifest per variant (<out>/variants/<voice>-<engine>.json) listing its
+files, sizes, durations and hashes.
+
+    python3 -m audiogen.matrix --voices Ruth,Danielle [--engines long-form,neural] [slug ...]
+"""
+import argparse
+import json
+import os
+from dataclasses import replace
+
+from audiogen import backends
+from audiogen.cache import PartCache
+from audiogen.catalog import load
+from audiogen.pipeline import build
+from audiogen.scheduler import WORKERS
+from audiogen.sync import digest
+
+
+def variant_name(voice, engine):
+    return f"{voice.lower()}-{engine}"
+
+
+def expand(tracks, voices, engines):
+    """[(variant name, base track, variant track)] for every combination."""
+    out = []
+    for t in tracks:
+        for voice in voices:
+            for engine in engines:
+                name = variant_name(voice, engine)
+                out.append((name, t, replace(t, slug=f"{t.slug}--{name}", voice=voice, engine=engine, text=t.parts)))
+    return out
+
+
+def manifest(name, voice, engine, rows, out_dir):
+    entries = []
+    for base, track, info in rows:
+        entries.append({'slug': base.slug, 'file': track.filename, 'bytes': info['bytes'],
+                        'durationSeconds': round(info['seconds'], 1), 'sha256': digest(info['path'])})
+    data = {'variant': name, 'voice': voice, 'engine': engine, 'tracks': entries}
+    path = os.path.join(out_dir, f"{name}.json")
+    with open(path, 'w') as f: json.dump(data, f, indent=2)
+    return path
+
+
+def build_matrix(tracks, voices, engines, backend=None, out_dir=None, cache=None, **kw):
+    """Build every variant in one run; returns {variant name: manifest path}."""
+    if not isinstance(backend, backends.Backend):
+        backend = backends.get(backend)
+    out_dir = out_dir or os.path.join(backend.out_dir, 'variants')
+    plan = expand(tracks, voices, engines)
+    built = build([v for _, _, v in plan], backend=backend, out_dir=out_dir,
+                  cache=cache or PartCache(), **kw)
+    manifests = {}
+    for voice in voices:
+        for engine in engines:
+            name = variant_name(voice, engine)
+            # A variant with problems was not published and may be missing parts.
+            rows = [(base, v, built[v.slug]) for n, base, v in plan
+                    if n == name and v.slug in built and not built[v.slug]['problems']]
+            manifests[name] = manifest(name, voice, engine, rows, out_dir)
+    return manifests
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Render tracks across several voices and engines.')
+    ap.add_argument('slugs', nargs='*', help='track slugs (default: all)')
+    ap.add_argument('--voices', required=True, help='comma-separated Polly voice IDs')
+    ap.add_argument('--engines', default='long-form', help='comma-separated engines (default: long-form)')
+    ap.add_argument('--backend', choices=sorted(backends.BACKENDS), help='default: $DRIFTLAB_BACKEND or polly')
+    ap.add_argument('--workers', type=int, default=WORKERS)
+    ap.add_argument('--smooth', action='store_true', help='trim and crossfade part seams')
+    args = ap.parse_args()
+
+    voices, engines = args.voices.split(','), args.engines.split(',')
+    tracks = load(args.slugs)
+    print(f"\nDriftLab Matrix: {len(tracks)} tracks x {len(voices)} voices x {len(engines)} engines\n")
+    for name, path in build_matrix(tracks, voices, engines, args.backend, workers=args.workers,
+                                   smooth=args.smooth).items():
+        with open(path) as f: n = len(json.load(f)['tracks'])
+        print(f"  {name:<24} {n} tracks  {path}")
@@ -0,0 +1,140 @@
+"""
+MPEG audio (Layer III) frame parsing.
+Polly returns plain MP3 frame streams; bundled files may also carry ID3 tags
+and Xing/Info header frames. walk() splits a buffer into those pieces without
+decoding anything, which is all assembly, scanning and slicing need.
+"""
+from collections import namedtuple
+
+FRAME, ID3, JUNK, TRUNCATED = 'frame', 'id3', 'junk', 'truncated'
+
+# kbps by MPEG version (1 = MPEG-1, 2 = MPEG-2 and 2.5), Layer III only.
+BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+Frame = namedtuple('Frame', 'size version bitrate sample_rate channels samples crc')
+Piece = namedtuple('Piece', 'kind offset size frame')
+
+_headers = {}
+
+
+def parse(buf, off):
+    """The Layer III frame header at `off`, or None."""
+    if off + 4 > len(buf) or buf[off] != 0xFF:
+        return None
+    key = bytes(buf[off + 1:off + 4])
+    if key not in _headers:
+        _headers[key] = _decode(*key)
+    return _headers[key]
+
+
+def _decode(b1, b2, b3):
+    ver, layer = (b1 >> 3) & 3, (b1 >> 1) & 3
+    bri, sri = b2 >> 4, (b2 >> 2) & 3
+    if (b1 & 0xE0) != 0xE0 or ver == 1 or layer != 1 or bri in (0, 15) or sri == 3:
+        return None
+    mpeg1 = ver == 3
+    bitrate = BITRATES[1 if mpeg1 else 2][bri] * 1000
+    rate = SAMPLE_RATES[ver][sri]
+    size = (144 if mpeg1 else 72) * bitrate // rate + ((b2 >> 1) & 1)
+    return Frame(size, ver, bitrate, rate, 1 if (b3 >> 6) == 3 else 2, 1152 if mpeg1 else 576, not b1 & 1)
+
+
+def id3_size(buf, off):
+    """Length of the ID3v2 tag at `off`, or 0."""
+    if buf[off:off + 3] != b'ID3' or off + 10 > len(buf):
+        return 0
+    s = buf[off + 6:off + 10]
+    return 10 + (s[0] << 21 | s[1] << 14 | s[2] << 7 | s[3]) + (10 if buf[off + 5] & 0x10 else 0)
+
+
+def side_info(frame):
+    return (17 if frame.channels == 1 else 32) if frame.version == 3 else (9 if frame.channels == 1 else 17)
+
+
+def main_data_begin(buf, off, frame):
+    """How many bytes back, in earlier frames, this frame's main data starts (the bit reservoir)."""
+    at = off + 4 + (2 if frame.crc else 0)
+    return buf[at] << 1 | buf[at + 1] >> 7 if frame.version == 3 else buf[at]
+
+
+def is_info(buf, off, frame):
+    """True for a Xing/Info/VBRI header frame (metadata, decodes as silence)."""
+    at = off + 4 + (2 if frame.crc else 0) + side_info(frame)
+    return buf[at:at + 4] in (b'Xing', b'Info') or buf[off + 36:off + 40] == b'VBRI'
+
+
+def _synced(buf, off):
+    """A frame header at `off` that is followed by another header, a tag, or EOF."""
+    f = parse(buf, off)
+    if not f:
+        return False
+    nxt = off + f.size
+    return nxt >= len(buf) or parse(buf, nxt) is not None or buf[nxt:nxt + 3] in (b'ID3', b'TAG')
+
+
+def resync(buf, off):
+    """Offset of the next plausible frame or ID3 tag at or after `off` (len(buf) if none)."""
+    n = len(buf)
+    tag = buf.find(b'ID3', off)
+    tag = n if tag < 0 else tag
+    pos = buf.find(b'\xff', off, tag)
+    while pos >= 0:
+        if _synced(buf, pos):
+            return pos
+        pos = buf.find(b'\xff', pos + 1, tag)
+    return tag
+
+
+def walk(buf, start=0):
+    """Yield Pieces (frames, ID3 tags, junk, a truncated tail) covering buf[start:]."""
+    n, off = len(buf), start
+    while off < n:
+        f = parse(buf, off)
+        if f and off + f.size <= n:
+            yield Piece(FRAME, off, f.size, f)
+            off += f.size
+            continue
+        size = id3_size(buf, off)
+        if size:
+            yield Piece(ID3, off, min(size, n - off), None)
+            off += size
+            continue
+        if n - off == 128 and buf[off:off + 3] == b'TAG':
+            yield Piece(ID3, off, 128, None)
+            return
+        if f and _synced(buf, off):
+            yield Piece(TRUNCATED, off, n - off, f)
+            return
+        nxt = resync(buf, off + 1)
+        yield Piece(JUNK, off, nxt - off, None)
+        off = nxt
+
+
+def audio_frames(buf):
+    """(offset, Frame) for every audio frame, skipping tags, junk and Info headers."""
+    out, prev = [], None
+    for p in walk(buf):
+        # Info headers only ever open a stream, so only the first frame of a run can be one.
+        if p.kind == FRAME and not (prev != FRAME and is_info(buf, p.offset, p.frame)):
+            out.append((p.offset, p.frame))
+        prev = p.kind
+    return out
+
+
+def duration(frames):
+    return sum(f.samples / f.sample_rate for _, f in frames)
+
+
+def silence(seconds, sample_rate=24000, bitrate=48000):
+    """Mono Layer III frames that decode to `seconds` of silence (Polly's default format)."""
+    ver = next(v for v, rates in SAMPLE_RATES.items() if sample_rate in rates)
+    mpeg1 = ver == 3
+    bri = BITRATES[1 if mpeg1 else 2].index(bitrate // 1000)
+    header = bytes((0xFF, 0xE3 | ver << 3, bri << 4 | SAMPLE_RATES[ver].index(sample_rate) << 2, 0xC4))
+    frame = header + bytes(_decode(*header[1:]).size - 4)
+    samples = 1152 if mpeg1 else 576
+    return frame * round(seconds * sample_rate / samples)
@@ -0,0 +1,203 @@
+"""
+Silence and pacing analysis: did Polly honour the SSML <break>s, and do the
+part seams add gaps of their own?
+
+Silent regions come from an RMS-threshold detector over 20 ms windows,
+computed block by block. Each expected break (from the SSML, positioned with
+the duration model and re-anchored on every match) is lined up with the
+nearest detected silence, and drift is reported per part and per seam.
+
+The part seams of a build are kept next to the track as <name>.seams (a
+JSON list of seconds), so analysing a built track later still knows where
+its parts meet; files from before that carry them as mid-file ID3 tags.
+
+    python3 -m audiogen.pacing [slug ...]   (analyses already-built tracks)
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+
+from audiogen import durations, mp3, ssml
+
+WINDOW = 0.02
+THRESHOLD_DB = -55.0
+MIN_SILENCE = 0.25
+# Breaks shorter than this are indistinguishable from natural pauses.
+MIN_BREAK = 0.5
+# A break must land within this many seconds (or this fraction of the part so far) of its predicted start.
+SLACK_SECONDS = 6.0
+SLACK_FRACTION = 0.15
+# Length mismatch counts this many times more than position mismatch when matching.
+LENGTH_WEIGHT = 4.0
+# Warn when a break comes out shorter than this share of what the SSML asked for.
+SHORT_BREAK = 0.8
+# Warn when a seam adds more than this much silence beyond the breaks around it.
+SEAM_TOLERANCE = 1.0
+
+
+class Pacing:
+    def __init__(self, sample_rate):
+        self.rate = sample_rate
+        self.win = int(sample_rate * WINDOW)
+        self.carry = np.empty(0, np.float32)
+        self.silent = []
+
+    def feed(self, start, block):
+        x = np.concatenate((self.carry, block)) if len(self.carry) else block
+        n = len(x) // self.win * self.win
+        w = x[:n].reshape(-1, self.win)
+        self.carry = x[n:]
+        rms = np.sqrt(np.mean(w * w, axis=1, dtype=np.float64))
+        self.silent.append(20 * np.log10(rms + 1e-12) < THRESHOLD_DB)
+
+    def regions(self):
+        """(start, end) seconds of every silence at least MIN_SILENCE long."""
+        if not self.silent:
+            return np.empty((0, 2))
+        s = np.concatenate(self.silent).astype(np.int8)
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], s, [0]))))
+        runs = edges.reshape(-1, 2) * WINDOW
+        return runs[runs[:, 1] - runs[:, 0] >= MIN_SILENCE]
+
+    def report(self, track, info):
+        seams = info.get('seams') or []
+        if info.get('path'):
+            save_seams(info['path'], seams)
+        result = align(track, self.regions(), [0.0] + seams)
+        return {'pacing': result, 'warnings': warnings(result)}
+
+
+def expected(part, voice, engine):
+    """[(offset into the part, seconds)] of every break, predicted with the duration model."""
+    per_word, break_scale, _ = durations.coefficients_for(voice, engine)
+    t, out = 0.0, []
+    for seg in ssml.segments(part):
+        if isinstance(seg, ssml.Break):
+            out.append((t, seg.seconds))
+            t += seg.seconds * break_scale
+        else:
+            t += seg.words * per_word / seg.rate
+    return out
+
+
+def align(track, regions, part_starts):
+    """Match expected breaks to detected silences; returns {'parts': [...], 'seams': [...]}."""
+    parts, j = [], 0
+    starts = list(part_starts) + [None] * (len(track.parts) - len(part_starts))
+    for i, part in enumerate(track.parts):
+        base = starts[i] if starts[i] is not None else (regions[j - 1][1] if j else 0.0)
+        shift, breaks = 0.0, []
+        for offset, want in expected(part, track.voice, track.engine):
+            if want < MIN_BREAK:
+                continue
+            at = base + offset + shift
+            slack = max(SLACK_SECONDS, SLACK_FRACTION * (offset + shift))
+            best = None
+            for k in range(j, len(regions)):
+                start, end = regions[k]
+                if start > at + slack:
+                    break
+                if start < at - slack:
+                    continue
+                cost = abs(start - at) + LENGTH_WEIGHT * abs((end - start) - want)
+                if best is None or cost < best[0]:
+                    best = (cost, k)
+            if best is None:
+                breaks.append({'at': at, 'want': want, 'got': None})
+                continue
+            k = best[1]
+            start, end = regions[k]
+            breaks.append({'at': float(start), 'want': want, 'got': float(end - start)})
+            shift += start - at
+            j = k + 1
+        got = [b for b in breaks if b['got'] is not None]
+        parts.append({
+            'part': i + 1, 'breaks': len(breaks), 'matched': len(got),
+            'drift': sum(b['got'] - b['want'] for b in got),
+            'short': sum(b['got'] < SHORT_BREAK * b['want'] for b in got),
+            'detail': breaks,
+        })
+    seams = []
+    for i, t in enumerate(part_starts[1:], 1):
+        around = [(s, e) for s, e in regions if s - WINDOW <= t <= e + WINDOW]
+        gap = float(around[0][1] - around[0][0]) if around else 0.0
+        before = expected(track.parts[i - 1], track.voice, track.engine)
+        trailing = before[-1][1] if before and _ends_with_break(track.parts[i - 1]) else 0.0
+        seams.append({'after_part': i, 'at': t, 'gap': gap, 'extra': gap - trailing})
+    return {'parts': parts, 'seams': seams}
+
+
+def _ends_with_break(part):
+    segs = ssml.segments(part)
+    return bool(segs) and isinstance(segs[-1], ssml.Break)
+
+
+def warnings(result):
+    out = []
+    for p in result['parts']:
+        if p['matched'] < p['breaks']:
+            out.append(f"part {p['part']}: {p['breaks'] - p['matched']} of {p['breaks']} breaks not found")
+        if p['short']:
+            out.append(f"part {p['part']}: {p['short']} break(s) shorter than asked")
+    for s in result['seams']:
+        if s['extra'] > SEAM_TOLERANCE:
+            out.append(f"seam after part {s['after_part']}: {s['extra']:.1f}s extra silence")
+    return out
+
+
+def tag_seams(path):
+    """Part boundaries of a byte-concatenated file: the times of its mid-file ID3 tags."""
+    with open(path, 'rb') as f: buf = f.read()
+    t, seams, audio = 0.0, [], False
+    for p in mp3.walk(buf):
+        if p.kind == mp3.FRAME:
+            t += p.frame.samples / p.frame.sample_rate
+            audio = True
+        elif p.kind == mp3.ID3 and audio:
+            seams.append(t)
+    return seams
+
+
+def seams_path(path):
+    return os.path.splitext(path)[0] + '.seams'
+
+
+def save_seams(path, seams):
+    out = seams_path(path)
+    with open(out + '.tmp', 'w') as f: json.dump([round(t, 3) for t in seams], f)
+    os.replace(out + '.tmp', out)
+
+
+def read_seams(path):
+    """Part boundaries of a built track, from its .seams sidecar or else its mid-file ID3 tags."""
+    try:
+        with open(seams_path(path)) as f: return json.load(f)
+    except OSError:
+        return tag_seams(path)
+
+
+if __name__ == '__main__':
+    from audiogen import analysis, decode
+    from audiogen.catalog import OUTPUT_DIR, load
+    ap = argparse.ArgumentParser(description='Check that SSML breaks landed in built tracks.')
+    ap.add_argument('slugs', nargs='*')
+    ap.add_argument('--dir', default=OUTPUT_DIR)
+    args = ap.parse_args()
+    if not analysis.available():
+        raise SystemExit('needs numpy and ffmpeg')
+
+    for track in load(args.slugs):
+        path = os.path.join(args.dir, track.filename)
+        if not os.path.exists(path):
+            continue
+        p = Pacing(decode.SAMPLE_RATE)
+        for start, block in decode.blocks(path):
+            p.feed(start, block)
+        report = p.report(track, {'seams': read_seams(path)})
+        parts = '  '.join(f"p{x['part']} {x['matched']}/{x['breaks']} {x['drift']:+.1f}s" for x in report['pacing']['parts'])
+        seams = '  '.join(f"{s['extra']:+.1f}s" for s in report['pacing']['seams'])
+        print(f"  {track.slug:<28} {parts}  | seams {seams or '-'}")
+        for w in report['warnings']:
+            print(f"      {w}")
@@ -0,0 +1,270 @@
+"""
+Staged build pipeline.
+
+    synthesize (threads, network) -> assemble + post steps (processes, CPU) -> publish (thread)
+
+Parts go to disk as they land, so only paths travel between stages. The
+queues between stages are bounded: when assembly falls behind, synthesis
+workers block handing over finished tracks, and when publishing falls behind
+the CPU stage stops taking new tracks. Memory stays flat however large the
+catalog is.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from audiogen import analysis, backends, mp3, preview, scan, trace
+from audiogen.cache import part_key
+from audiogen.ledger import Ledger
+from audiogen.scheduler import WORKERS, billed_chars, jobs
+
+DONE = object()
+
+
+def gen(job, backend, out_dir, record=None, cache=None):
+    if cache:
+        key = part_key(job.ssml, job.track.voice, job.track.engine, backend.name)
+        fp = os.path.join(out_dir, job.filename)
+        if cache.get(key, fp):
+            print(f"    {job.filename} (cached)")
+            return fp
+    start, audio, meta, fp = time.perf_counter(), b'', {}, None
+    try:
+        with trace.span('request', backend=backend.name, engine=job.track.engine):
+            audio, meta = backend.request(job.ssml, job.track.voice, job.track.engine)
+        latency = time.perf_counter() - start
+        fp = os.path.join(out_dir, job.filename)
+        with trace.span('write', bytes=len(audio)):
+            # Replaced, never rewritten: a part left by an aborted build may be hard-linked to a cache entry.
+            with open(fp + '.tmp', 'wb') as f: f.write(audio)
+            os.replace(fp + '.tmp', fp)
+        print(f"    {job.filename} ({len(audio)/1024:.0f} KB)")
+        if cache:
+            cache.put(key, fp)
+    except Exception as e:
+        latency = time.perf_counter() - start
+        print(f"    ERROR {job.filename}: {e}")
+    if record:
+        try:
+            record(engine=job.track.engine, voice=job.track.voice, track=job.track.slug, part=job.index + 1,
+                   chars=meta.get('chars') or billed_chars(job.ssml), latency=latency, ttfb=meta.get('ttfb'),
+                   bytes=len(audio), retries=meta.get('retries', 0), pool_wait=meta.get('pool_wait'),
+                   ok=fp is not None)
+        except Exception as e:
+            print(f"    ERROR recording {job.filename}: {e}")
+    return fp
+
+
+def _copy(o, buf, frames):
+    """Write `frames` of `buf` to `o` in contiguous runs; returns their duration."""
+    start = end = None
+    for off, f in frames:
+        if off != end:
+            if start is not None: o.write(buf[start:end])
+            start = off
+        end = off + f.size
+    if start is not None: o.write(buf[start:end])
+    return mp3.duration(frames)
+
+
+def assemble(track, parts, out, post=(), traced=False, smooth=False):
+    """Join the audio frames of `parts` into `out`, dropping per-part tags and Info headers.
+
+    Runs in a worker process. With `smooth`, each seam between consecutive
+    parts goes through audiogen.seams. Each `post` step is called as
+    step(track, out, info) and may return a dict that is merged into the
+    result; 'problems' lists accumulate and keep the track from being
+    published, 'warnings' accumulate and are only printed. info['seams'] holds
+    the times where parts meet, info['pcm'] the decoded PCM intermediate once a
+    step has set it; it is removed when the steps finish. With `traced`, the
+    worker's spans come back in info['trace'].
+    """
+    trace.enable(traced)
+    seconds, missing, joins, trimmed = 0.0, 0, [], 0.0
+    prev = None  # (part index, buf, frames, first frame not yet written)
+    # Written under a temporary name and renamed, so a hard link into the app bundle is never rewritten in place.
+    tmp = out + '.tmp'
+    with trace.span('assemble', out=os.path.basename(out)), open(tmp, 'wb') as o:
+        for i, p in enumerate(parts):
+            if not (p and os.path.exists(p)):
+                missing += 1
+                continue
+            with trace.span('read'):
+                with open(p, 'rb') as f: buf = f.read()
+            with trace.span('frames'):
+                frames = mp3.audio_frames(buf)
+            os.remove(p)
+            skip = 0
+            if prev:
+                j, pbuf, pframes, pstart = prev
+                cut = None
+                if smooth and j == i - 1:
+                    from audiogen import seams
+                    with trace.span('seam'):
+                        want = seams.edge_breaks(track.parts[j])[1] + seams.edge_breaks(track.parts[i])[0]
+                        cut = seams.smooth(pbuf, pframes, buf, frames, want)
+                with trace.span('copy'):
+                    if cut:
+                        seconds += _copy(o, pbuf, pframes[pstart:cut['keep']])
+                        joins.append(seconds + cut['seam'])
+                        o.write(cut['frames'])
+                        seconds += mp3.duration(mp3.audio_frames(cut['frames']))
+                        skip, trimmed = cut['skip'], trimmed + cut['trimmed']
+                    else:
+                        seconds += _copy(o, pbuf, pframes[pstart:])
+                        joins.append(seconds)
+            prev = (i, buf, frames, skip)
+        if prev:
+            with trace.span('copy'):
+                seconds += _copy(o, prev[1], prev[2][prev[3]:])
+    os.replace(tmp, out)
+    info = {'path': out, 'bytes': os.path.getsize(out), 'seconds': seconds, 'missing': missing, 'seams': joins,
+            'trimmed': trimmed, 'problems': [f"{missing} part(s) missing"] if missing else [], 'warnings': []}
+    try:
+        for step in post:
+            with trace.span(getattr(step, '__name__', 'post')):
+                result = dict(step(track, out, info) or {})
+            info['problems'] += result.pop('problems', [])
+            info['warnings'] += result.pop('warnings', [])
+            info.update(result)
+    finally:
+        if info.get('pcm'):
+            from audiogen import decode
+            decode.remove(info.pop('pcm'))
+    if traced:
+        info['trace'] = trace.drain()
+    return info
+
+
+def post_steps(post=(), smooth=False):
+    """The full post chain ahead of `post`, and whether seam smoothing can run here."""
+    if analysis.available():
+        from audiogen import decode
+        decode.clear_stale()
+        decoded = (analysis.intermediate,) if analysis.needs_pcm(post) else ()
+        return (scan.check, preview.step, *decoded, analysis.analyze, *post), smooth
+    print("  (numpy/ffmpeg not found: skipping pacing analysis and seam smoothing)")
+    return (scan.check, preview.step, *post), False
+
+
+def build(tracks, workers=WORKERS, backend=None, out_dir=None, cpu_workers=None, post=(), publish=None, depth=None,
+          ledger=None, smooth=False, cache=None):
+    """Build `tracks` through the staged pipeline; returns {slug: assemble() info}.
+
+    `backend` is a name or instance from audiogen.backends (default: polly, or
+    $DRIFTLAB_BACKEND). Every track is checked with audiogen.scan.check, gets a
+    preview clip (audiogen.preview) and, when numpy and ffmpeg are present, goes
+    through audiogen.analysis.analyze before any extra `post` steps; a step with
+    `pcm = True` set on it reads the decoded track from info['pcm']
+    (audiogen.decode), which is only written when one asks for it;
+    `publish(track, info)` is called from the publish stage for every finished
+    track that has no problems. Every request is recorded in `ledger` (default:
+    audiogen.ledger.LEDGER; pass False to skip). With `smooth`, part seams are
+    trimmed and crossfaded (audiogen.seams) instead of byte-appended. With a
+    `cache` (audiogen.cache.PartCache), parts whose SSML is unchanged are
+    reused instead of synthesized.
+    """
+    if not isinstance(backend, backends.Backend):
+        backend = backends.get(backend)
+    backend.reserve(workers)
+    out_dir = out_dir or backend.out_dir
+    os.makedirs(out_dir, exist_ok=True)
+    tracks = [t for t in backend.prepare(tracks) if t.parts]
+    post, smooth = post_steps(post, smooth)
+    cpu_workers = cpu_workers or os.cpu_count() or 1
+    ready, finished = queue.Queue(depth or workers), queue.Queue(depth or cpu_workers)
+    landed = {t.slug: [None] * len(t.parts) for t in tracks}
+    remaining = {t.slug: len(t.parts) for t in tracks}
+    lock = threading.Lock()
+    started, built = set(), {}
+    owned = ledger is None
+    if owned:
+        ledger = Ledger()
+    run = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+    def record(**row):
+        ledger.record(build=run, workers=workers, backend=backend.name, **row)
+
+    def synthesize(job):
+        with lock:
+            if job.track.slug not in started:
+                started.add(job.track.slug)
+                trace.begin('track', job.track.slug, track=job.track.slug)
+        with trace.span('synthesize', track=job.track.slug, part=job.index + 1):
+            path = gen(job, backend, out_dir, record if ledger else None, cache)
+        with lock:
+            landed[job.track.slug][job.index] = path
+            remaining[job.track.slug] -= 1
+            complete = not remaining[job.track.slug]
+        if complete:
+            with trace.span('wait:assembly'):
+                ready.put(job.track)
+
+    def process():
+        pending, closed = {}, False
+
+        def flush(block):
+            done, _ = wait(pending, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+            for f in done:
+                with trace.span('wait:publish'):
+                    finished.put((pending.pop(f), f))
+
+        try:
+            with ProcessPoolExecutor(cpu_workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+                while True:
+                    try:
+                        track = ready.get(timeout=0.05 if pending else None)
+                    except queue.Empty:
+                        track = None
+                    if track is DONE:
+                        closed = True
+                        break
+                    if track:
+                        out = os.path.join(out_dir, track.filename)
+                        pending[pool.submit(assemble, track, landed[track.slug], out, post, trace.ENABLED,
+                                            smooth)] = track
+                    if pending:
+                        flush(block=len(pending) >= cpu_workers)
+                while pending:
+                    flush(block=True)
+        finally:
+            finished.put(DONE)
+            # If this stage died, keep draining so synthesis never blocks on a full queue.
+            while not closed:
+                closed = ready.get() is DONE
+
+    def publishing():
+        while (item := finished.get()) is not DONE:
+            track, f = item
+            try:
+                info = f.result()
+                trace.extend(info.pop('trace', []))
+                if info['problems']:
+                    print(f"  ERROR {track.filename}: {'; '.join(info['problems'])} (not published)")
+                else:
+                    print(f"  >> {track.filename} ({info['bytes']/1024/1024:.1f} MB)")
+                for w in info['warnings']:
+                    print(f"     warning: {w}")
+                if publish and not info['problems']:
+                    with trace.span('publish', track=track.slug):
+                        publish(track, info)
+                built[track.slug] = info
+            except Exception as e:
+                print(f"  ERROR {track.filename}: {e}")
+            trace.end('track', track.slug)
+
+    stages = [threading.Thread(target=process, name='assemble'), threading.Thread(target=publishing, name='publish')]
+    for s in stages: s.start()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='synthesize') as pool:
+            list(pool.map(synthesize, jobs(tracks)))
+    finally:
+        ready.put(DONE)
+        for s in stages: s.join()
+        if owned:
+            ledger.close()
+    return built
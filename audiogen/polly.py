@@ -0,0 +1,38 @@
+"""
+AWS clients for Polly synthesis (see audiogen.backends).
+Setup: pip3 install boto3 && aws configure
+
+DRIFTLAB_POLLY_REGIONS (comma-separated, default us-east-1) lists the regions
+synthesize_speech may use; with more than one, the synthesis client is a
+regions.ClientPool that balances and fails over between them. Synthesis
+tasks and S3 stay in the first (home) region, next to the content bucket.
+Build synthesis clients through audiogen.clients.shared(), not directly.
+"""
+import os
+
+import boto3
+from botocore.config import Config
+
+from audiogen.regions import ClientPool
+
+REGIONS = [r.strip() for r in os.environ.get('DRIFTLAB_POLLY_REGIONS', 'us-east-1').split(',') if r.strip()]
+
+s3 = boto3.client('s3', region_name=REGIONS[0])
+
+
+def synthesis_client(size):
+    """A Polly client with `size` keep-alive connections per region."""
+    config = Config(max_pool_connections=size, tcp_keepalive=True)
+    home = boto3.client('polly', region_name=REGIONS[0], config=config)
+    if len(REGIONS) == 1:
+        return home
+    # One attempt per region: the pool retries by failing over, where botocore would keep retrying one region.
+    single = config.merge(Config(retries={'total_max_attempts': 1}))
+    return ClientPool({r: boto3.client('polly', region_name=r, config=single) for r in REGIONS}, home=home)
+
+
+def home_client(client):
+    """The home-region client inside a synthesis client, for synthesis tasks (with botocore's retries)."""
+    if isinstance(client, ClientPool):
+        return client.home or client.endpoints[0].client
+    return client
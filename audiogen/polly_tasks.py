@@ -0,0 +1,104 @@
+"""
+Long-form batch synthesis through Polly speech synthesis tasks.
+A task takes a whole script (up to 100,000 billed characters) and writes the
+MP3 to the content bucket, so a story needs no client-side splitting or
+concatenation. TaskBatch keeps every outstanding task on one poller that backs
+off while nothing finishes; each result is downloaded by the pipeline worker
+waiting on it, so downloads run in parallel.
+"""
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+
+from audiogen.scheduler import billed_chars
+
+CONTENT_BUCKET = os.environ.get('DRIFTLAB_CONTENT_BUCKET', '')
+TASK_PREFIX = 'polly-tasks/'
+MAX_TASK_CHARS = 100000
+
+SPEAK = re.compile(r'^\s*<speak>|</speak>\s*$')
+
+
+def whole(track):
+    """`track` with its parts merged into one script, when that fits in a single task."""
+    if len(track.parts) < 2:
+        return track
+    ssml = '<speak>\n' + '\n'.join(SPEAK.sub('', p).strip() for p in track.parts) + '\n</speak>'
+    if billed_chars(ssml) > MAX_TASK_CHARS:
+        return track
+    return replace(track, text=[ssml])
+
+
+def s3_location(uri):
+    """(bucket, key) from a task OutputUri like https://s3.<region>.amazonaws.com/<bucket>/<key>."""
+    return tuple(uri.split('/', 3)[3].split('/', 1))
+
+
+class TaskBatch:
+    """Submit tasks, poll them together, hand back the audio bytes."""
+
+    def __init__(self, polly, s3, bucket=CONTENT_BUCKET, prefix=TASK_PREFIX, interval=1.0, max_interval=20.0, poll_workers=8):
+        if not bucket:
+            raise ValueError('no content bucket: set DRIFTLAB_CONTENT_BUCKET')
+        self.polly, self.s3, self.bucket, self.prefix = polly, s3, bucket, prefix
+        self.interval, self.max_interval, self.poll_workers = interval, max_interval, poll_workers
+        self.outstanding = {}
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.poller = None
+
+    def submit(self, ssml, voice, engine):
+        """Start a task; the Future resolves to the finished SynthesisTask."""
+        r = self.polly.start_speech_synthesis_task(
+            Text=ssml, TextType='ssml', OutputFormat='mp3', VoiceId=voice, Engine=engine,
+            OutputS3BucketName=self.bucket, OutputS3KeyPrefix=self.prefix)
+        future = Future()
+        with self.lock:
+            self.outstanding[r['SynthesisTask']['TaskId']] = future
+            if self.poller is None:
+                self.poller = threading.Thread(target=self._poll, daemon=True)
+                self.poller.start()
+        self.wake.set()
+        return future
+
+    def synthesize(self, ssml, voice, engine):
+        """Same contract as audiogen.polly.synthesize, for use as the pipeline's synth."""
+        task = self.submit(ssml, voice, engine).result()
+        bucket, key = s3_location(task['OutputUri'])
+        audio = self.s3.get_object(Bucket=bucket, Key=key)['Body'].read()
+        self.s3.delete_object(Bucket=bucket, Key=key)
+        return audio
+
+    def _status(self, task_id):
+        try:
+            return self.polly.get_speech_synthesis_task(TaskId=task_id)['SynthesisTask']
+        except Exception:
+            return None  # throttled or transient; try again next round
+
+    def _poll(self):
+        delay = self.interval
+        with ThreadPoolExecutor(max_workers=self.poll_workers) as pool:
+            while True:
+                with self.lock:
+                    ids = list(self.outstanding)
+                if not ids:
+                    self.wake.wait()
+                    self.wake.clear()
+                    delay = self.interval
+                    continue
+                settled = 0
+                for task in pool.map(self._status, ids):
+                    if not task or task['TaskStatus'] not in ('completed', 'failed'):
+                        continue
+                    with self.lock:
+                        future = self.outstanding.pop(task['TaskId'])
+                    if task['TaskStatus'] == 'completed':
+                        future.set_result(task)
+                    else:
+                        future.set_exception(RuntimeError(task.get('TaskStatusReason', 'synthesis task failed')))
+                    settled += 1
+                delay = self.interval if settled else min(delay * 2, self.max_interval)
+                self.wake.wait(delay)
+                self.wake.clear()
@@ -0,0 +1,155 @@
+"""
+Technical QC: clipping, DC offset, noise floor and sibilance, per part.
+
+The Quality analyzer runs in the shared decode pass (audiogen.analysis) and
+measures every WINDOW of audio at once with NumPy: peak and clipped-sample
+count, mean (DC), RMS, and the mean-square level above SIBILANCE_HZ from a
+windowed FFT (loud sibilants are what makes a take harsh). Windows are
+grouped into parts at the seams from build(); a part is flagged when it
+clips, sits off centre, has an audible floor in its pauses, or is much
+noisier or more sibilant than the other parts of its track (a bad synthesis
+usually differs from its neighbours more than from any absolute limit).
+Flags are warnings; nothing blocks publishing.
+
+    python3 -m audiogen.qc [slug ...] [--dir DIR]   (built tracks, in parallel; exits 1 on any flag)
+"""
+import argparse
+import os
+
+import numpy as np
+
+WINDOW = 0.05
+CLIP_LEVEL = 0.999
+CLIP_SAMPLES = 10
+DC_LIMIT = 0.005
+# Windows quieter than this are pauses; the noise floor is their median level.
+SPEECH_GATE_DB = -40.0
+NOISE_FLOOR_DB = -60.0
+SIBILANCE_HZ = 5000
+# A part is an outlier when it is this far above the median of its track's parts.
+FLOOR_MARGIN_DB = 10.0
+SIBILANCE_MARGIN_DB = 4.0
+SILENT_DB = -120.0
+
+
+def db(x):
+    return 10 * np.log10(np.maximum(x, 10 ** (SILENT_DB / 10)))
+
+
+class Quality:
+    def __init__(self, sample_rate):
+        self.rate = sample_rate
+        self.win = int(sample_rate * WINDOW)
+        self.carry = np.empty(0, np.float32)
+        self.taper = np.hanning(self.win).astype(np.float32)
+        self.high = np.fft.rfftfreq(self.win, 1 / sample_rate) >= SIBILANCE_HZ
+        # One-sided spectrum power back to mean square of the (tapered) window.
+        self.scale = 2 / (self.win * np.sum(self.taper.astype(np.float64) ** 2))
+        self.cols = {k: [] for k in ('peak', 'clipped', 'mean', 'power', 'high')}
+
+    def feed(self, start, block):
+        x = np.concatenate((self.carry, block)) if len(self.carry) else block
+        n = len(x) // self.win * self.win
+        w = x[:n].reshape(-1, self.win)
+        self.carry = x[n:]
+        a = np.abs(w)
+        spectrum = np.abs(np.fft.rfft(w * self.taper, axis=1)) ** 2
+        self.cols['peak'].append(a.max(axis=1, initial=0.0))
+        self.cols['clipped'].append(np.count_nonzero(a >= CLIP_LEVEL, axis=1))
+        self.cols['mean'].append(w.mean(axis=1, dtype=np.float64))
+        self.cols['power'].append(np.mean(w * w, axis=1, dtype=np.float64))
+        self.cols['high'].append(spectrum[:, self.high].sum(axis=1) * self.scale)
+
+    def parts(self, seams):
+        """Per-part measurements, splitting windows at `seams` (seconds)."""
+        cols = {k: np.concatenate(v) if v else np.empty(0) for k, v in self.cols.items()}
+        which = np.searchsorted(np.asarray(seams, dtype=np.float64), np.arange(len(cols['peak'])) * WINDOW,
+                                side='right')
+        out = []
+        for i in range(len(seams) + 1):
+            sel = which == i
+            if not sel.any():
+                continue
+            level = db(cols['power'][sel])
+            speech, pause = level >= SPEECH_GATE_DB, level < SPEECH_GATE_DB
+            out.append({
+                'part': i + 1,
+                'peak_db': float(20 * np.log10(max(cols['peak'][sel].max(), 1e-6))),
+                'clipped': int(cols['clipped'][sel].sum()),
+                'dc': float(cols['mean'][sel].mean()),
+                'floor_db': float(np.median(level[pause])) if pause.any() else None,
+                'sibilance_db': float(np.percentile(db(cols['high'][sel][speech]), 95)) if speech.any() else None,
+            })
+        return out
+
+    def report(self, track, info):
+        parts = self.parts(info.get('seams') or [])
+        return {'qc': parts, 'warnings': flags(parts)}
+
+
+def _median(parts, key):
+    values = [p[key] for p in parts if p[key] is not None]
+    return float(np.median(values)) if len(values) > 2 else None
+
+
+def flags(parts):
+    out = []
+    floor, sib = _median(parts, 'floor_db'), _median(parts, 'sibilance_db')
+    for p in parts:
+        name = f"part {p['part']}"
+        if p['clipped'] > CLIP_SAMPLES:
+            out.append(f"{name}: {p['clipped']} clipped samples (peak {p['peak_db']:+.1f} dBFS)")
+        if abs(p['dc']) > DC_LIMIT:
+            out.append(f"{name}: DC offset {p['dc']:+.4f}")
+        if p['floor_db'] is not None and p['floor_db'] > NOISE_FLOOR_DB:
+            out.append(f"{name}: noise floor {p['floor_db']:.0f} dBFS in pauses")
+        elif p['floor_db'] is not None and floor is not None and p['floor_db'] > floor + FLOOR_MARGIN_DB:
+            out.append(f"{name}: noise floor {p['floor_db']:.0f} dBFS, "
+                       f"{p['floor_db'] - floor:.0f} dB above the other parts")
+        if p['sibilance_db'] is not None and sib is not None and p['sibilance_db'] > sib + SIBILANCE_MARGIN_DB:
+            out.append(f"{name}: sibilance {p['sibilance_db'] - sib:.1f} dB above the other parts")
+    return out
+
+
+def _num(v, width, places):
+    return f"{v:{width}.{places}f}" if v is not None else '-'.rjust(width)
+
+
+def check(path, slug=None):
+    """QC one built file, split at its part seams (pacing.read_seams). Returns (slug, parts, warnings)."""
+    from audiogen import decode
+    from audiogen.pacing import read_seams
+    q = Quality(decode.SAMPLE_RATE)
+    for start, block in decode.blocks(path):
+        q.feed(start, block)
+    parts = q.parts(read_seams(path))
+    return slug, parts, flags(parts)
+
+
+if __name__ == '__main__':
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    from audiogen import analysis
+    from audiogen.catalog import OUTPUT_DIR, load
+    ap = argparse.ArgumentParser(description='Measure clipping, DC, noise floor and sibilance of built tracks.')
+    ap.add_argument('slugs', nargs='*')
+    ap.add_argument('--dir', default=OUTPUT_DIR)
+    args = ap.parse_args()
+    if not analysis.available():
+        raise SystemExit('needs numpy and ffmpeg')
+
+    todo = [(os.path.join(args.dir, t.filename), t.slug) for t in load(args.slugs)]
+    paths, slugs = [p for p, _ in todo if os.path.exists(p)], [s for p, s in todo if os.path.exists(p)]
+    start, flagged = time.perf_counter(), 0
+    with ProcessPoolExecutor() as pool:
+        for slug, parts, warnings in pool.map(check, paths, slugs):
+            flagged += bool(warnings)
+            cells = '  '.join(f"p{p['part']} {p['peak_db']:+5.1f} {_num(p['floor_db'], 4, 0)} "
+                              f"{_num(p['sibilance_db'], 5, 1)}" for p in parts)
+            print(f"  {slug:<28} {cells}")
+            for w in warnings:
+                print(f"      {w}")
+    print(f"\n{len(paths)} tracks in {time.perf_counter() - start:.2f}s, {flagged} flagged "
+          f"(per part: peak dBFS, pause floor dBFS, 95th-percentile level above {SIBILANCE_HZ} Hz dBFS)")
+    raise SystemExit(1 if flagged else 0)
@@ -0,0 +1,134 @@
+"""
+Multi-region Polly client pool.
+
+ClientPool answers synthesize_speech like a single boto3 client, spreading
+requests over several regional endpoints. Each endpoint keeps an exponentially
+weighted latency and an in-flight count; a request goes to the healthy
+endpoint with the lowest expected wait (latency x queue). Throttling, 5xx
+and connection errors put an endpoint in a cooldown that doubles on every
+consecutive failure, and the request fails over to the next endpoint. Errors
+in the request itself (bad SSML, unknown voice) are raised straight away.
+
+Audio does not depend on the region, so part cache keys leave it out.
+Configure with DRIFTLAB_POLLY_REGIONS=us-east-1,us-west-2,eu-west-1.
+
+    python3 -m audiogen.regions   (demo against local stand-ins with different latency and throttling)
+"""
+import threading
+import time
+
+RETRYABLE = {'ThrottlingException', 'Throttling', 'TooManyRequestsException', 'ServiceUnavailableException',
+             'ServiceFailureException', 'InternalFailure', 'RequestTimeout', 'RequestTimeoutException'}
+# Weight of the newest sample in each endpoint's latency average.
+ALPHA = 0.3
+COOLDOWN = 1.0
+MAX_COOLDOWN = 30.0
+
+
+def error_code(e):
+    """The AWS error code of a botocore-style ClientError, or None for anything else."""
+    return (getattr(e, 'response', None) or {}).get('Error', {}).get('Code')
+
+
+class Endpoint:
+    def __init__(self, region, client):
+        self.region, self.client = region, client
+        self.latency = None
+        self.in_flight = self.requests = self.failures = self.streak = 0
+        self.down_until = 0.0
+
+    def healthy(self, now):
+        return now >= self.down_until
+
+    def expected_wait(self):
+        # Unmeasured endpoints look free, so each gets tried early.
+        return (self.latency or 0.0) * (self.in_flight + 1)
+
+    def stats(self):
+        return {'region': self.region, 'requests': self.requests, 'failures': self.failures,
+                'latency_ms': round(self.latency * 1000) if self.latency is not None else None,
+                'healthy': self.healthy(time.monotonic())}
+
+
+class ClientPool:
+    def __init__(self, clients, home=None):
+        """`clients` maps region name to a boto3 Polly client (or a stand-in).
+
+        `home` is a client for calls that stay in one region and are not balanced (synthesis tasks).
+        """
+        self.endpoints = [Endpoint(r, c) for r, c in clients.items()]
+        self.home = home
+        self.lock = threading.Lock()
+
+    def _pick(self, tried):
+        now = time.monotonic()
+        with self.lock:
+            free = [e for e in self.endpoints if e not in tried]
+            if not free:
+                return None
+            # When everything is cooling down, use whichever recovers first rather than failing the build.
+            pool = [e for e in free if e.healthy(now)] or [min(free, key=lambda e: e.down_until)]
+            e = min(pool, key=Endpoint.expected_wait)
+            e.in_flight += 1
+            return e
+
+    def _done(self, e, seconds=None, failed=False):
+        with self.lock:
+            e.in_flight -= 1
+            e.requests += 1
+            if failed:
+                e.failures += 1
+                e.streak += 1
+                e.down_until = time.monotonic() + min(MAX_COOLDOWN, COOLDOWN * 2 ** (e.streak - 1))
+            else:
+                e.streak = 0
+                e.latency = seconds if e.latency is None else (1 - ALPHA) * e.latency + ALPHA * seconds
+
+    def synthesize_speech(self, **kw):
+        tried, last = [], None
+        while (e := self._pick(tried)) is not None:
+            tried.append(e)
+            start = time.perf_counter()
+            try:
+                r = e.client.synthesize_speech(**kw)
+            except Exception as err:
+                code = error_code(err)
+                if code is not None and code not in RETRYABLE:
+                    self._done(e, time.perf_counter() - start)
+                    raise
+                self._done(e, failed=True)
+                last = err
+                continue
+            self._done(e, time.perf_counter() - start)
+            meta = r.setdefault('ResponseMetadata', {})
+            meta['RetryAttempts'] = meta.get('RetryAttempts', 0) + len(tried) - 1
+            meta['Region'] = e.region
+            return r
+        raise last
+
+    def stats(self):
+        with self.lock:
+            return [e.stats() for e in self.endpoints]
+
+
+if __name__ == '__main__':
+    from concurrent.futures import ThreadPoolExecutor
+
+    from audiogen.standins import LocalPolly
+    profiles = {
+        'local-fast': LocalPolly(latency=0.05, region='local-fast'),
+        'local-slow': LocalPolly(latency=0.4, region='local-slow'),
+        'local-throttled': LocalPolly(latency=0.02, tps=4, region='local-throttled'),
+        'local-down': LocalPolly(down=True, region='local-down'),
+    }
+    pool = ClientPool(profiles)
+    ssml = '<speak>Rest now. <break time="1s"/> Let the day go.</speak>'
+    start = time.perf_counter()
+    with ThreadPoolExecutor(8) as ex:
+        results = list(ex.map(lambda _: pool.synthesize_speech(Text=ssml, TextType='ssml', OutputFormat='mp3',
+                                                                VoiceId='Ruth', Engine='long-form'), range(80)))
+    print(f"80 requests in {time.perf_counter() - start:.2f}s, "
+          f"{sum(r['ResponseMetadata']['RetryAttempts'] for r in results)} failovers\n")
+    for s in pool.stats():
+        print(f"  {s['region']:<16} {s['requests']:>4} requests {s['failures']:>3} failed  "
+              f"{s['latency_ms'] if s['latency_ms'] is not None else '-':>5} ms  {'up' if s['healthy'] else 'cooling down'}")
@@ -0,0 +1,141 @@
+"""
+Release build output to the content bucket under immutable, hash-versioned keys.
+
+Every file in the build output (tracks, previews, waveform sidecars, matrix
+variants, renditions, routines, HLS playlists and their manifests) goes up as
+<name>.<sha256 prefix><ext> next to where it sits locally, with a year-long
+immutable Cache-Control; HLS segments are already named by their hash and
+keep their names. Objects the previous release already points at are not
+uploaded again. Then release.json, the pointer manifest mapping each local
+path to its current key, is rewritten and is the one path invalidated at
+CloudFront, in a single batch, and only when something changed. Old objects
+stay in the bucket for clients still on an earlier release.
+
+Manifests keep their local file names; the app resolves every name through
+release.json.
+
+    python3 -m audiogen.release [--dir DIR] [--dry-run] [--local ROOT]
+
+Needs DRIFTLAB_CONTENT_BUCKET and DRIFTLAB_DISTRIBUTION_ID, or --local to
+release into audiogen.standins' S3 and CloudFront stand-ins under ROOT.
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from audiogen.catalog import OUTPUT_DIR
+from audiogen.polly_tasks import CONTENT_BUCKET
+from audiogen.regions import error_code
+from audiogen.sync import digest
+
+DISTRIBUTION_ID = os.environ.get('DRIFTLAB_DISTRIBUTION_ID', '')
+POINTER = 'release.json'
+EXTENSIONS = ('.mp3', '.wave', '.json', '.m3u8')
+HASH_CHARS = 12
+IMMUTABLE = 'public, max-age=31536000, immutable'
+# Clients revalidate the pointer on every launch; an unchanged one is a 304.
+POINTER_CACHE = 'no-cache'
+CONTENT_TYPES = {'.mp3': 'audio/mpeg', '.json': 'application/json', '.m3u8': 'application/vnd.apple.mpegurl',
+                 '.wave': 'application/octet-stream'}
+UPLOAD_WORKERS = 8
+
+
+def versioned(rel, sha):
+    if os.path.basename(os.path.dirname(rel)) == 'segments':
+        return rel
+    stem, ext = os.path.splitext(rel)
+    return f"{stem}.{sha[:HASH_CHARS]}{ext}"
+
+
+def objects(src_dir=OUTPUT_DIR):
+    """{local path relative to src_dir: (file, versioned key)} for everything to release."""
+    out = {}
+    for root, dirs, files in os.walk(src_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for name in sorted(files):
+            if name.endswith(EXTENSIONS) and not name.startswith('.'):
+                path = os.path.join(root, name)
+                rel = os.path.relpath(path, src_dir).replace(os.sep, '/')
+                out[rel] = (path, versioned(rel, digest(path)))
+    return out
+
+
+def current(s3, bucket):
+    """The released pointer manifest, or None before the first release."""
+    try:
+        return json.loads(s3.get_object(Bucket=bucket, Key=POINTER)['Body'].read())
+    except Exception as e:
+        if error_code(e) in ('NoSuchKey', '404'):
+            return None
+        raise
+
+
+def upload(s3, bucket, path, key):
+    with open(path, 'rb') as f:
+        s3.put_object(Bucket=bucket, Key=key, Body=f, CacheControl=IMMUTABLE,
+                      ContentType=CONTENT_TYPES.get(os.path.splitext(key)[1], 'application/octet-stream'))
+
+
+def release(src_dir=OUTPUT_DIR, s3=None, cdn=None, bucket=CONTENT_BUCKET, distribution=DISTRIBUTION_ID,
+            dry_run=False):
+    """Upload what is new, repoint release.json and invalidate it once; returns a summary."""
+    if not bucket:
+        raise ValueError('no content bucket: set DRIFTLAB_CONTENT_BUCKET')
+    if s3 is None:
+        from audiogen import polly
+        s3 = polly.s3
+    found = objects(src_dir)
+    mapping = {rel: key for rel, (_, key) in found.items()}
+    prev = (current(s3, bucket) or {}).get('objects', {})
+    have = set(prev.values())
+    todo = [(path, key) for path, key in found.values() if key not in have]
+    tag = hashlib.sha256(json.dumps(mapping, sort_keys=True).encode()).hexdigest()[:8]
+    rid = f"{time.strftime('%Y%m%d-%H%M%S')}-{tag}"
+    summary = {'release': rid, 'objects': len(mapping), 'uploaded': len(todo),
+               'bytes': sum(os.path.getsize(path) for path, _ in todo),
+               'changed': sorted(rel for rel in mapping if prev.get(rel) != mapping[rel]),
+               'removed': sorted(set(prev) - set(mapping)), 'invalidated': []}
+    if dry_run or mapping == prev:
+        summary['release'] = None if mapping == prev else rid
+        return summary
+    with ThreadPoolExecutor(UPLOAD_WORKERS) as pool:
+        list(pool.map(lambda pk: upload(s3, bucket, *pk), todo))
+    pointer = {'release': rid, 'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()), 'objects': mapping}
+    s3.put_object(Bucket=bucket, Key=POINTER, Body=json.dumps(pointer, indent=1).encode(),
+                  CacheControl=POINTER_CACHE, ContentType=CONTENT_TYPES['.json'])
+    if distribution:
+        if cdn is None:
+            import boto3
+            cdn = boto3.client('cloudfront')
+        paths = ['/' + POINTER]
+        cdn.create_invalidation(DistributionId=distribution, InvalidationBatch={
+            'Paths': {'Quantity': len(paths), 'Items': paths}, 'CallerReference': rid})
+        summary['invalidated'] = paths
+    return summary
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Release build output under versioned keys.')
+    ap.add_argument('--dir', default=OUTPUT_DIR)
+    ap.add_argument('--dry-run', action='store_true', help='report what would be uploaded')
+    ap.add_argument('--local', metavar='ROOT', help='release into local S3/CloudFront stand-ins under ROOT')
+    args = ap.parse_args()
+
+    s3 = cdn = None
+    bucket, distribution = CONTENT_BUCKET, DISTRIBUTION_ID
+    if args.local:
+        from audiogen.standins import LocalCloudFront, LocalS3
+        bucket, distribution = bucket or 'driftlab-content', distribution or 'local'
+        s3 = LocalS3(args.local)
+        cdn = LocalCloudFront(s3, bucket)
+    r = release(args.dir, s3, cdn, bucket, distribution, args.dry_run)
+    print(f"\n{r['release'] or 'nothing to release'}: {r['objects']} objects, {len(r['changed'])} changed, "
+          f"{len(r['removed'])} removed, {r['uploaded']} uploaded ({r['bytes'] / 1024 / 1024:.1f} MB)"
+          f"{', invalidated ' + ' '.join(r['invalidated']) if r['invalidated'] else ''}")
+    for rel in r['changed'][:20]:
+        print(f"  {rel}")
+    if len(r['changed']) > 20:
+        print(f"  ... and {len(r['changed']) - 20} more")
@@ -0,0 +1,144 @@
+"""
+Short, medium and long renditions of a story from the same paragraphs.
+
+A story's script is split into paragraphs (the text up to and including each
+<break>), each wrapped in its part's <prosody> so it reads exactly as it does
+in the full script. A rendition keeps the opening and closing paragraphs and
+an evenly spread selection of the middle ones whose predicted length
+(audiogen.durations) comes closest to its share of the whole story.
+
+Every paragraph is synthesized once, as part of the long rendition, and goes
+into the part cache; the shorter renditions are then assembled from cached
+paragraphs at copy speed, so all three cost about the same synthesis as the
+story alone. Output goes to <out>/renditions/<slug>--<length>.mp3 with a
+manifest per story (<out>/renditions/<slug>.json).
+
+    python3 -m audiogen.renditions [--backend polly|draft] [slug ...]   (default: every story)
+"""
+import argparse
+import json
+import os
+import re
+from dataclasses import replace
+
+from audiogen import backends, durations
+from audiogen.cache import PartCache
+from audiogen.catalog import load
+from audiogen.pipeline import build
+from audiogen.scheduler import WORKERS
+from audiogen.sync import digest
+
+# Share of the full story's predicted length; 'long' must stay 1.0 so it holds every paragraph.
+LENGTHS = {'short': 0.4, 'medium': 0.7, 'long': 1.0}
+OPENING = 1
+CLOSING = 1
+
+PROSODY = re.compile(r'(<prosody[^>]*>)(.*?)</prosody>', re.S)
+PARAGRAPH = re.compile(r'.*?<break[^>]*/>|.*\S', re.S)
+TAG = re.compile(r'<[^>]+>')
+
+
+def paragraphs(track):
+    """Every paragraph of `track` as a standalone <speak> document, in script order.
+
+    A run of breaks with no words between them stays with the paragraph before it
+    (or, at the very start, the one after), rather than becoming a request of its own.
+    """
+    out, pending = [], ''
+    for part in track.parts:
+        inner = part.strip()[len('<speak>'):-len('</speak>')]
+        blocks = PROSODY.findall(inner) or [('', inner)]
+        for tag, body in blocks:
+            for p in PARAGRAPH.findall(body):
+                p = p.strip()
+                if not p:
+                    continue
+                if TAG.sub('', p).strip():
+                    out.append([tag, pending + p])
+                    pending = ''
+                elif out:
+                    out[-1][1] += '\n' + p
+                else:
+                    pending += p + '\n'
+    return ['\n'.join(['<speak>', tag, text, '</prosody>', '</speak>'] if tag else ['<speak>', text, '</speak>'])
+            for tag, text in out]
+
+
+def spread(n, k):
+    """`k` indices spread evenly over range(n)."""
+    return [int((i + 0.5) * n / k) for i in range(k)]
+
+
+def length(paras, voice, engine):
+    """Predicted seconds of speech and pauses (durations.predict_speech: no per-part term for paragraphs)."""
+    return durations.predict_speech(paras, voice, engine)
+
+
+def choose(paras, voice, engine, share):
+    """Indices of the paragraphs for a rendition `share` of the full length."""
+    head, tail = list(range(min(OPENING, len(paras)))), list(range(max(OPENING, len(paras) - CLOSING), len(paras)))
+    middle = list(range(len(head), len(paras) - len(tail)))
+    target = share * length(paras, voice, engine)
+    best = None
+    for k in range(len(middle) + 1):
+        picked = head + [middle[i] for i in spread(len(middle), k)] + tail
+        miss = abs(length([paras[i] for i in picked], voice, engine) - target)
+        if best is None or miss < best[0]:
+            best = (miss, picked)
+    return best[1]
+
+
+def plan(tracks, lengths=LENGTHS):
+    """[(length, base track, rendition track, paragraph indices)] for every story and length."""
+    out = []
+    for t in tracks:
+        paras = paragraphs(t)
+        for name, share in lengths.items():
+            picked = choose(paras, t.voice, t.engine, share)
+            out.append((name, t, replace(t, slug=f"{t.slug}--{name}", text=[paras[i] for i in picked]), picked))
+    return out
+
+
+def manifest(base, rows, out_dir):
+    data = {'slug': base.slug, 'name': base.name, 'renditions': {
+        name: {'file': track.filename, 'paragraphs': picked, 'bytes': info['bytes'],
+               'durationSeconds': round(info['seconds'], 1), 'sha256': digest(info['path'])}
+        for name, track, picked, info in rows}}
+    path = os.path.join(out_dir, f"{base.slug}.json")
+    with open(path, 'w') as f: json.dump(data, f, indent=2)
+    return path
+
+
+def build_renditions(tracks, backend=None, out_dir=None, cache=None, lengths=LENGTHS, **kw):
+    """Build every rendition of `tracks`; returns {slug: manifest path}."""
+    if not isinstance(backend, backends.Backend):
+        backend = backends.get(backend)
+    out_dir = out_dir or os.path.join(backend.out_dir, 'renditions')
+    cache = cache or PartCache()
+    todo = plan(tracks, lengths)
+    counts = {t.slug: len(paragraphs(t)) for t in tracks}
+    # The full renditions synthesize every paragraph; the rest then come out of the cache.
+    full = {r.slug: r for _, base, r, picked in todo if len(picked) == counts[base.slug]}
+    built = build(list(full.values()), backend=backend, out_dir=out_dir, cache=cache, **kw)
+    built.update(build([r for _, _, r, _ in todo if r.slug not in full], backend=backend, out_dir=out_dir,
+                       cache=cache, **kw))
+    manifests = {}
+    for t in tracks:
+        rows = [(name, r, picked, built[r.slug]) for name, base, r, picked in todo if base is t and r.slug in built]
+        manifests[t.slug] = manifest(t, rows, out_dir)
+    return manifests
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Render short, medium and long versions of stories.')
+    ap.add_argument('slugs', nargs='*', help='story slugs (default: every story)')
+    ap.add_argument('--backend', choices=sorted(backends.BACKENDS), help='default: $DRIFTLAB_BACKEND or polly')
+    ap.add_argument('--workers', type=int, default=WORKERS)
+    ap.add_argument('--smooth', action='store_true', help='trim and crossfade part seams')
+    args = ap.parse_args()
+
+    tracks = load(args.slugs) if args.slugs else [t for t in load() if t.slug.startswith('story-')]
+    print(f"\nDriftLab Renditions: {len(tracks)} stories x {len(LENGTHS)} lengths\n")
+    for slug, path in build_renditions(tracks, args.backend, workers=args.workers, smooth=args.smooth).items():
+        with open(path) as f: r = json.load(f)['renditions']
+        print(f"  {slug:<28} " + '  '.join(f"{n} {v['durationSeconds'] / 60:.1f} min" for n, v in r.items()))
@@ -0,0 +1,136 @@
+"""
+Routine tracks: several finished catalog tracks (breathing, then meditation,
+then story) rendered into one continuous MP3 with a chapter index, so the app
+plays a routine as a single stream from a single fetch.
+
+Routines are defined in scripts/routines.json:
+
+    {"slug": "routine-wind-down", "name": "...", "tracks": [slug, ...], "gap": 0.0}
+
+Pieces are spliced frame by frame. Every piece is brought down to the level
+of the quietest one by lowering its frames' global_gain (1.5 dB steps, as in
+audiogen.preview), so nothing is re-encoded and nothing can clip. A piece in
+a different MPEG format from the first is decoded and re-encoded to match.
+Each file's first frame never borrows from the bit reservoir, so the frames
+of a spliced piece decode exactly as they did on their own.
+
+Output: driftlab-audio/routines/<slug>.mp3 and <slug>.json (chapters with start times,
+durations and the gain applied). Needs numpy and ffmpeg to measure loudness.
+
+    python3 -m audiogen.routines [slug ...] [--dir DIR]
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+
+from audiogen import catalog, decode, mp3, seams
+from audiogen.durations import BUNDLED_DIR
+from audiogen.preview import DB_PER_STEP, attenuate
+from audiogen.sync import digest
+
+ROUTINES = os.path.join(catalog.SCRIPTS_DIR, 'routines.json')
+ROUTINES_DIR = os.path.join(catalog.OUTPUT_DIR, 'routines')
+
+# Loudness is gated like BS.1770 (without the K-weighting): 400 ms windows,
+# silence below ABS_GATE dropped, then anything RELATIVE_GATE dB under the rest.
+LOUDNESS_WINDOW = 0.4
+ABS_GATE = -50.0
+RELATIVE_GATE = -10.0
+
+
+def definitions(path=ROUTINES):
+    with open(path, encoding='utf-8') as f: return {r['slug']: r for r in json.load(f)}
+
+
+def locate(slug, dirs):
+    for d in dirs:
+        path = os.path.join(d, f"{slug}.mp3")
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"{slug}.mp3 is not built (looked in {', '.join(dirs)})")
+
+
+def loudness(path):
+    """Gated loudness of `path` in dBFS, or None if it is all silence."""
+    win, powers = int(decode.SAMPLE_RATE * LOUDNESS_WINDOW), []
+    for _, block in decode.blocks(path):
+        w = block[:len(block) // win * win].reshape(-1, win)
+        powers.append(np.mean(w * w, axis=1, dtype=np.float64))
+    p = np.concatenate(powers) if powers else np.zeros(0)
+    p = p[p > 10 ** (ABS_GATE / 10)]
+    if not len(p):
+        return None
+    p = p[p > p.mean() * 10 ** (RELATIVE_GATE / 10)]
+    return 10 * np.log10(p.mean())
+
+
+def fmt(frame):
+    return frame.version, frame.sample_rate, frame.channels, frame.bitrate
+
+
+def render(routine, dirs=(catalog.OUTPUT_DIR, BUNDLED_DIR), out_dir=ROUTINES_DIR, levels=None):
+    """Write one routine and its chapter index; returns the index."""
+    slugs, gap = routine['tracks'], routine.get('gap', 0.0)
+    paths = [locate(s, dirs) for s in slugs]
+    levels = {} if levels is None else levels
+    for p in paths:
+        if p not in levels:
+            levels[p] = loudness(p)
+    target = min((levels[p] for p in paths if levels[p] is not None), default=0.0)
+    names = {t.slug: t.name for t in catalog.load()}
+
+    out, chapters, t, base = bytearray(), [], 0.0, None
+    for i, (slug, path) in enumerate(zip(slugs, paths)):
+        with open(path, 'rb') as f: buf = f.read()
+        frames = mp3.audio_frames(buf)
+        base = base or frames[0][1]
+        reencoded = any(fmt(f) != fmt(base) for _, f in frames)
+        if reencoded:
+            buf = seams.encode(seams.decode(buf, base.sample_rate), base)
+            frames = mp3.audio_frames(buf)
+        steps = round((levels[path] - target) / DB_PER_STEP) if levels[path] is not None else 0
+        for off, f in frames:
+            data = bytearray(buf[off:off + f.size])
+            attenuate(data, f, steps)
+            out += data
+        seconds = mp3.duration(frames)
+        chapters.append({'slug': slug, 'name': names.get(slug, slug), 'startSeconds': round(t, 3),
+                         'durationSeconds': round(seconds, 3), 'gainDb': -steps * DB_PER_STEP,
+                         'reencoded': reencoded})
+        t += seconds
+        if gap and i < len(slugs) - 1:
+            quiet = mp3.silence(gap, base.sample_rate, base.bitrate)
+            out += quiet
+            t += mp3.duration(mp3.audio_frames(quiet))
+
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"{routine['slug']}.mp3")
+    with open(path + '.tmp', 'wb') as f: f.write(out)
+    os.replace(path + '.tmp', path)
+    index = {'slug': routine['slug'], 'name': routine['name'], 'file': os.path.basename(path),
+             'bytes': len(out), 'durationSeconds': round(t, 1), 'sha256': digest(path), 'chapters': chapters}
+    with open(os.path.join(out_dir, f"{routine['slug']}.json"), 'w') as f: json.dump(index, f, indent=2)
+    return index
+
+
+if __name__ == '__main__':
+    from audiogen import analysis
+    ap = argparse.ArgumentParser(description='Render routines into single gapless tracks with chapter indexes.')
+    ap.add_argument('slugs', nargs='*', help='routine slugs (default: all)')
+    ap.add_argument('--dir', action='append', help=f"where built tracks are (default: {catalog.OUTPUT_DIR}, "
+                                                   f"then {BUNDLED_DIR})")
+    ap.add_argument('--out', default=ROUTINES_DIR)
+    args = ap.parse_args()
+    if not analysis.available():
+        raise SystemExit('needs numpy and ffmpeg')
+
+    routines = definitions()
+    levels = {}
+    for slug in args.slugs or routines:
+        r = render(routines[slug], args.dir or (catalog.OUTPUT_DIR, BUNDLED_DIR), args.out, levels)
+        print(f"\n  {r['file']}  {r['durationSeconds'] / 60:.1f} min  {r['bytes'] / 1024 / 1024:.1f} MB")
+        for c in r['chapters']:
+            print(f"    {c['startSeconds'] / 60:>5.1f} min  {c['name']:<28} {c['gainDb']:+.1f} dB"
+                  f"{'  (re-encoded)' if c['reencoded'] else ''}")
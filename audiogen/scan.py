@@ -0,0 +1,142 @@
+"""
+MP3 integrity scanner.
+Memory-maps each file and walks the frame sync chain, reporting junk between
+frames, embedded (mid-file) ID3 tags and Info headers, truncated tails, format
+changes and duration against the catalog. Files are scanned in parallel.
+
+    python3 -m audiogen.scan [file-or-dir ...]   (default: driftlab-audio/ and assets/audio/)
+
+Exits non-zero when any file has problems, so it can gate publishing. The
+pipeline runs check() on every assembled track and will not publish a track
+that fails it; there the expected duration is predicted from the SSML
+(audiogen.durations.predict_speech), so a part that came back short or
+empty blocks the track, and a mismatch with the catalog is only a warning.
+"""
+import argparse
+import glob
+import json
+import mmap
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from audiogen import durations, mp3
+from audiogen.catalog import OUTPUT_DIR
+
+CONTENT_JSON = './data/sampleContent.json'
+AUDIO_ASSETS_TS = './lib/audioAssets.ts'
+BUNDLED_DIR = './assets/audio'
+
+# Allowed duration drift against the catalog: the larger of these.
+TOLERANCE = 0.03
+TOLERANCE_SECONDS = 2.0
+# Against the duration model's speech-and-pauses prediction, which runs 0-11% long on built tracks.
+PREDICTED_TOLERANCE = 0.15
+
+
+def content_items(content=CONTENT_JSON, assets=AUDIO_ASSETS_TS):
+    """{filename: sampleContent.json item} for catalog items that map to an audio file."""
+    try:
+        with open(content) as f: items = {i['id']: i for i in json.load(f)}
+        with open(assets) as f: files = re.findall(r"'([\w-]+)':\s*require\('[^']*/([^/']+\.mp3)'\)", f.read())
+    except OSError:
+        return {}
+    return {name: items[cid] for cid, name in files if cid in items}
+
+
+def expected_durations(content=CONTENT_JSON, assets=AUDIO_ASSETS_TS):
+    """{filename: durationSeconds} for catalog items that map to an audio file."""
+    return {name: item['durationSeconds'] for name, item in content_items(content, assets).items()
+            if item.get('durationSeconds')}
+
+
+def scan(path, expected=None, tolerance=TOLERANCE):
+    """Walk one file; returns a report dict with a 'problems' list."""
+    r = {'path': path, 'bytes': os.path.getsize(path), 'frames': 0, 'seconds': 0.0, 'junk': 0, 'junk_bytes': 0,
+         'id3_mid': 0, 'info_mid': 0, 'truncated': 0, 'formats': set(), 'expected': expected,
+         'tolerance': tolerance}
+    if r['bytes']:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            audio_seen, prev, frames = False, None, {}
+            for p in mp3.walk(buf):
+                if p.kind == mp3.FRAME:
+                    # Info headers only ever open a stream, so only the first frame of a run can be one.
+                    if prev != mp3.FRAME and mp3.is_info(buf, p.offset, p.frame):
+                        r['info_mid'] += audio_seen
+                        prev = p.kind
+                        continue
+                    audio_seen = True
+                    frames[p.frame] = frames.get(p.frame, 0) + 1
+                elif p.kind == mp3.ID3:
+                    r['id3_mid'] += audio_seen and p.offset + p.size < r['bytes']
+                elif p.kind == mp3.JUNK:
+                    r['junk'] += 1
+                    r['junk_bytes'] += p.size
+                else:
+                    r['truncated'] += 1
+                prev = p.kind
+        r['frames'] = sum(frames.values())
+        r['seconds'] = sum(n * f.samples / f.sample_rate for f, n in frames.items())
+        r['formats'] = {(f.sample_rate, f.channels) for f in frames}
+    r['problems'] = problems(r)
+    r['formats'] = sorted(r['formats'])
+    return r
+
+
+def problems(r):
+    out = []
+    if not r['frames']:
+        out.append('no audio frames')
+    if r['junk']:
+        out.append(f"{r['junk']} junk run(s), {r['junk_bytes']} bytes")
+    if r['id3_mid']:
+        out.append(f"{r['id3_mid']} mid-file ID3 tag(s)")
+    if r['info_mid']:
+        out.append(f"{r['info_mid']} mid-file Info header(s)")
+    if r['truncated']:
+        out.append('truncated last frame')
+    if len(r['formats']) > 1:
+        out.append(f"format changes mid-file: {sorted(r['formats'])}")
+    if r['expected']:
+        drift = r['seconds'] - r['expected']
+        if abs(drift) > max(r['tolerance'] * r['expected'], TOLERANCE_SECONDS):
+            out.append(f"duration {r['seconds']:.0f}s vs expected {r['expected']:.0f}s ({drift:+.0f}s)")
+    return out
+
+
+def check(track, path, info):
+    """Pipeline post step: structural problems of an assembled track, and a duration far from the prediction."""
+    r = scan(path, durations.predict_speech(track.parts, track.voice, track.engine), PREDICTED_TOLERANCE)
+    listed = expected_durations().get(track.filename)
+    warnings = []
+    if listed and abs(r['seconds'] - listed) > max(TOLERANCE * listed, TOLERANCE_SECONDS):
+        warnings.append(f"duration {r['seconds']:.0f}s vs {listed:.0f}s in the catalog")
+    return {'problems': r['problems'], 'warnings': warnings}
+
+
+def scan_all(paths, expected=None, workers=None):
+    expected = expected_durations() if expected is None else expected
+    files = []
+    for p in paths:
+        files.extend(sorted(glob.glob(os.path.join(p, '*.mp3'))) if os.path.isdir(p) else [p])
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(scan, files, [expected.get(os.path.basename(f)) for f in files]))
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Check MP3 frame integrity and durations.')
+    ap.add_argument('paths', nargs='*', default=[OUTPUT_DIR, BUNDLED_DIR])
+    ap.add_argument('--workers', type=int)
+    args = ap.parse_args()
+
+    start = time.perf_counter()
+    reports = scan_all(args.paths, workers=args.workers)
+    bad = [r for r in reports if r['problems']]
+    for r in reports:
+        status = '; '.join(r['problems']) or 'ok'
+        print(f"  {r['path']:<52} {r['frames']:>6} frames {r['seconds']:>6.0f}s  {status}")
+    total = sum(r['bytes'] for r in reports) / 1024 / 1024
+    print(f"\n{len(reports)} files, {total:.0f} MB in {time.perf_counter() - start:.2f}s: {len(bad)} with problems")
+    sys.exit(1 if bad else 0)
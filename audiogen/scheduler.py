@@ -0,0 +1,60 @@
+"""
+Cross-track scheduling.
+Every part of every requested track goes into one worker pool, longest
+estimated synthesis first (LPT), so a long story never starts last and
+stretches the build. A part's synthesis time is estimated from its predicted
+audio length (audiogen.durations) and the engine's speed. audiogen.pipeline
+runs the plan.
+"""
+import heapq
+import re
+from dataclasses import dataclass
+
+from audiogen import durations
+
+WORKERS = 4
+
+# Rough Polly wall-clock seconds per second of audio, plus a fixed cost per request.
+ENGINE_RTF = {'standard': 0.02, 'neural': 0.05, 'long-form': 0.12}
+REQUEST_OVERHEAD = 0.5
+
+TAG = re.compile(r'<[^>]+>')
+
+
+def billed_chars(ssml):
+    """Polly bills the text only; SSML tags are free."""
+    return len(TAG.sub('', ssml))
+
+
+def estimate(ssml, voice, engine):
+    seconds = durations.predict([ssml], voice, engine)
+    return REQUEST_OVERHEAD + seconds * ENGINE_RTF.get(engine, ENGINE_RTF['long-form'])
+
+
+@dataclass
+class Job:
+    track: object
+    index: int
+    ssml: str
+
+    @property
+    def filename(self):
+        return f"_{self.track.slug}_p{self.index + 1}.mp3"
+
+    @property
+    def cost(self):
+        return estimate(self.ssml, self.track.voice, self.track.engine)
+
+
+def jobs(tracks):
+    """All parts of all tracks, longest first."""
+    return sorted((Job(t, i, s) for t in tracks for i, s in enumerate(t.parts)),
+                  key=lambda j: j.cost, reverse=True)
+
+
+def makespan(costs, workers=WORKERS):
+    """Simulated wall time of handing `costs` (in order) to `workers` greedy workers."""
+    free = [0.0] * max(1, workers)
+    for c in costs:
+        heapq.heappush(free, heapq.heappop(free) + c)
+    return max(free)
@@ -0,0 +1,135 @@
+"""
+Seam smoothing for multi-part tracks.
+
+Parts are synthesized one request at a time, so every part boundary carries
+whatever leading and trailing padding Polly added plus a possible step in the
+waveform. smooth() decodes only a few seconds either side of a seam, trims the
+edge silence down to the breaks the SSML asked for plus SEAM_GAP, joins the
+two sides with a short equal-power crossfade and re-encodes just that window;
+every other frame is copied as-is.
+
+The window never reaches into speech, and it ends on a frame that does not
+borrow from the bit reservoir, so the untouched frames after it still decode.
+Needs numpy and ffmpeg with libmp3lame.
+"""
+import math
+import subprocess
+
+import numpy as np
+
+from audiogen import mp3, ssml
+from audiogen.pacing import THRESHOLD_DB
+
+# Seconds decoded either side of a seam, beyond the silence the SSML asks for there.
+WINDOW = 4.0
+# Silence kept at a seam on top of the SSML breaks around it.
+SEAM_GAP = 0.6
+FADE = 0.04
+# Re-encoded audio stays at least this far from speech.
+GUARD = 0.1
+# Frames decoded ahead of the tail window, for the reservoir and the MDCT overlap.
+PREROLL = 3
+# LAME's encoder + decoder delay, in samples.
+ENCODER_DELAY = 1105
+RMS_WINDOW = 0.02
+
+
+def edge_breaks(part):
+    """(leading, trailing) seconds of <break> at the edges of an SSML part."""
+    segs = ssml.segments(part)
+    lead = trail = 0.0
+    for seg in segs:
+        if not isinstance(seg, ssml.Break): break
+        lead += seg.seconds
+    for seg in reversed(segs):
+        if not isinstance(seg, ssml.Break): break
+        trail += seg.seconds
+    return lead, trail
+
+
+def decode(data, sample_rate):
+    cmd = ['ffmpeg', '-v', 'error', '-nostdin', '-f', 'mp3', '-i', 'pipe:0',
+           '-f', 'f32le', '-ac', '1', '-ar', str(sample_rate), 'pipe:1']
+    return np.frombuffer(subprocess.run(cmd, input=data, capture_output=True, check=True).stdout, '<f4')
+
+
+def encode(pcm, frame):
+    cmd = ['ffmpeg', '-v', 'error', '-nostdin', '-f', 'f32le', '-ar', str(frame.sample_rate), '-ac', '1', '-i', 'pipe:0',
+           '-c:a', 'libmp3lame', '-b:a', str(frame.bitrate), '-ac', str(frame.channels), '-reservoir', '0',
+           '-write_xing', '0', '-id3v2_version', '0', '-f', 'mp3', 'pipe:1']
+    return subprocess.run(cmd, input=pcm.astype('<f4').tobytes(), capture_output=True, check=True).stdout
+
+
+def loud(x, sample_rate):
+    """Per-RMS_WINDOW flags: True where `x` is above the silence threshold."""
+    win = int(sample_rate * RMS_WINDOW)
+    w = x[:len(x) // win * win].reshape(-1, win)
+    return 20 * np.log10(np.sqrt(np.mean(w * w, axis=1, dtype=np.float64)) + 1e-12) >= THRESHOLD_DB
+
+
+def crossfade(a, b, n):
+    if n <= 0:
+        return np.concatenate((a, b))
+    t = np.linspace(0, np.pi / 2, n, dtype=np.float32)
+    return np.concatenate((a[:-n], a[-n:] * np.cos(t) + b[:n] * np.sin(t), b[n:]))
+
+
+def _join(buf, frames):
+    return b''.join(buf[o:o + f.size] for o, f in frames)
+
+
+def smooth(a_buf, a_frames, b_buf, b_frames, want=0.0):
+    """Plan the seam between part A and part B (both as mp3.audio_frames).
+
+    `want` is the silence the SSML asks for at the seam. Returns None when
+    there is less than a frame to trim, else {'keep': A frames to copy,
+    'frames': re-encoded window bytes, 'skip': B frames it replaces,
+    'seam': seconds into the window where the parts meet, 'trimmed': seconds}.
+    """
+    if not a_frames or not b_frames:
+        return None
+    f = a_frames[0][1]
+    rate, spf = f.sample_rate, f.samples
+    span = math.ceil((want + WINDOW) * rate / spf)
+
+    ta = min(len(a_frames), span)
+    first = len(a_frames) - ta
+    pre = min(PREROLL, first)
+    a = decode(_join(a_buf, a_frames[first - pre:]), rate)[pre * spf:]
+    tb = min(len(b_frames), span)
+    b = decode(_join(b_buf, b_frames[:tb]), rate)[:tb * spf]
+    if len(a) != ta * spf or len(b) != tb * spf:
+        return None
+
+    win = int(rate * RMS_WINDOW)
+    la, lb = np.flatnonzero(loud(a, rate)), np.flatnonzero(loud(b, rate))
+    speech_end = (la[-1] + 1) * win if len(la) else 0
+    speech_start = lb[0] * win if len(lb) else len(b)
+    guard = int(GUARD * rate)
+
+    a0 = min(ta, -(-(speech_end + guard) // spf))
+    limit = max(0, (speech_start - guard) // spf)
+    b1 = max(k for k in range(limit + 1)
+             if k == 0 or mp3.main_data_begin(b_buf, b_frames[k][0], b_frames[k][1]) == 0)
+    sa, sb = len(a) - a0 * spf, b1 * spf
+    fixed = (a0 * spf - speech_end) + (speech_start - b1 * spf)
+    n = int(FADE * rate)
+    keep = min(sa + sb, max(int((want + SEAM_GAP) * rate) - fixed, 2 * n))
+    if sa + sb - keep < spf:
+        return None
+
+    kb = min(sb, keep // 2)
+    ka = min(sa, keep - kb)
+    kb = min(sb, keep - ka)
+    n = min(n, ka, kb)
+    x = crossfade(a[a0 * spf:a0 * spf + ka], b[b1 * spf - kb:b1 * spf], n)
+    count = max(1, round(len(x) / spf))
+    x = np.pad(x[:count * spf], (0, count * spf - min(len(x), count * spf)))
+    # Drop the frames holding the encoder delay so the window lines up with the frames around it.
+    skip = -(-ENCODER_DELAY // spf)
+    enc = encode(x, f)
+    out = mp3.audio_frames(enc)[skip:skip + count]
+    if len(out) < count:
+        return None
+    return {'keep': first + a0, 'frames': _join(enc, out), 'skip': b1, 'seam': float(ka - n / 2) / rate,
+            'trimmed': (sa + sb - count * spf) / rate}
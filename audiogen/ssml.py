@@ -0,0 +1,57 @@
+"""
+Just enough SSML reading for timing: words, prosody rate and breaks.
+segments() flattens a script into Speech and Break pieces in playback order.
+"""
+import html
+import re
+from collections import namedtuple
+
+TOKEN = re.compile(r'<(/?)([\w:-]+)([^>]*?)(/?)>|([^<]+)')
+ATTR = re.compile(r'([\w:-]+)="([^"]*)"')
+
+RATES = {'x-slow': 0.6, 'slow': 0.8, 'medium': 1.0, 'fast': 1.25, 'x-fast': 1.5}
+# Polly's pause for a <break> given only a strength.
+STRENGTHS = {'none': 0.0, 'x-weak': 0.1, 'weak': 0.25, 'medium': 0.5, 'strong': 1.0, 'x-strong': 1.5}
+
+Speech = namedtuple('Speech', 'words rate text')
+Break = namedtuple('Break', 'seconds')
+
+
+def seconds(value):
+    """'3s' / '500ms' -> seconds."""
+    value = value.strip()
+    return float(value[:-2]) / 1000 if value.endswith('ms') else float(value.rstrip('s'))
+
+
+def rate(value):
+    """'85%' / 'slow' -> multiplier of the voice's normal speed."""
+    value = value.strip()
+    return float(value[:-1]) / 100 if value.endswith('%') else RATES.get(value, 1.0)
+
+
+def segments(ssml):
+    rates, out = [1.0], []
+    for m in TOKEN.finditer(ssml):
+        closing, tag, attrs, empty, text = m.groups()
+        if text is not None:
+            words = text.split()
+            if words:
+                out.append(Speech(len(words), rates[-1], html.unescape(' '.join(words))))
+        elif tag == 'break':
+            a = dict(ATTR.findall(attrs))
+            out.append(Break(seconds(a['time']) if 'time' in a else STRENGTHS.get(a.get('strength'), 0.5)))
+        elif tag == 'prosody' and not empty:
+            if closing:
+                rates.pop()
+            else:
+                a = dict(ATTR.findall(attrs))
+                rates.append(rate(a['rate']) if 'rate' in a else rates[-1])
+    return out
+
+
+def breaks(ssml):
+    return [s.seconds for s in segments(ssml) if isinstance(s, Break)]
+
+
+def words(ssml):
+    return sum(s.words for s in segments(ssml) if isinstance(s, Speech))
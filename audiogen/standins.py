@@ -0,0 +1,136 @@
+"""
+Local stand-ins for the AWS calls the pipeline makes.
+They answer the same boto3-style calls from memory and a local directory, so
+backends and publish steps can be exercised without credentials or network.
+"""
+import io
+import os
+import threading
+import time
+import uuid
+
+from audiogen.backends import DraftBackend
+from audiogen.scheduler import billed_chars
+
+
+class LocalS3:
+    """S3 backed by a directory: <root>/<bucket>/<key>."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def _path(self, bucket, key):
+        return os.path.join(self.root, bucket, *key.split('/'))
+
+    def put_object(self, Bucket, Key, Body, **kw):
+        path = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f: f.write(Body if isinstance(Body, bytes) else Body.read())
+        return {}
+
+    def get_object(self, Bucket, Key, **kw):
+        try:
+            with open(self._path(Bucket, Key), 'rb') as f:
+                return {'Body': io.BytesIO(f.read())}
+        except FileNotFoundError:
+            raise LocalClientError('NoSuchKey', Key) from None
+
+    def delete_object(self, Bucket, Key, **kw):
+        path = self._path(Bucket, Key)
+        if os.path.exists(path):
+            os.remove(path)
+        return {}
+
+
+class LocalClientError(Exception):
+    """Shaped like botocore's ClientError: the AWS error code is in .response['Error']['Code']."""
+
+    def __init__(self, code, message=''):
+        super().__init__(f"{code}: {message}")
+        self.response = {'Error': {'Code': code, 'Message': message}}
+
+
+class LocalCloudFront:
+    """A CDN in front of one LocalS3 bucket: get() caches every object until an invalidation covers it."""
+
+    def __init__(self, s3, bucket):
+        self.s3, self.bucket = s3, bucket
+        self.cache, self.invalidations, self.fetches = {}, [], 0
+        self.lock = threading.Lock()
+
+    def get(self, path):
+        key = path.lstrip('/')
+        with self.lock:
+            if key not in self.cache:
+                self.cache[key] = self.s3.get_object(Bucket=self.bucket, Key=key)['Body'].read()
+                self.fetches += 1
+            return self.cache[key]
+
+    def create_invalidation(self, DistributionId, InvalidationBatch):
+        with self.lock:
+            for p in InvalidationBatch['Paths']['Items']:
+                p = p.lstrip('/')
+                for key in [k for k in self.cache if (k.startswith(p[:-1]) if p.endswith('*') else k == p)]:
+                    del self.cache[key]
+            inv = {'Id': uuid.uuid4().hex, 'Status': 'Completed', 'InvalidationBatch': InvalidationBatch}
+            self.invalidations.append(inv)
+        return {'Invalidation': inv}
+
+
+class LocalPolly:
+    """Polly with synthesize_speech and speech synthesis tasks.
+
+    Audio comes from `synth` (draft audio by default). `latency` delays every
+    synthesize_speech call; more than `tps` calls in one second raise
+    ThrottlingException, and a `down` endpoint always answers
+    ServiceUnavailableException. Tasks report inProgress for `task_latency`
+    seconds and then write their output to `s3`.
+    """
+
+    def __init__(self, s3=None, synth=None, latency=0.0, task_latency=0.5, region='local', tps=None, down=False):
+        self.s3, self.synth = s3, synth or DraftBackend().synthesize
+        self.latency, self.task_latency, self.region = latency, task_latency, region
+        self.tps, self.down = tps, down
+        self.tasks, self.calls = {}, []
+        self.lock = threading.Lock()
+
+    def _admit(self):
+        if self.down:
+            raise LocalClientError('ServiceUnavailableException', f"{self.region} is unavailable")
+        if self.tps is None:
+            return
+        now = time.monotonic()
+        with self.lock:
+            self.calls = [t for t in self.calls if now - t < 1.0]
+            if len(self.calls) >= self.tps:
+                raise LocalClientError('ThrottlingException', 'Rate exceeded')
+            self.calls.append(now)
+
+    def synthesize_speech(self, Text, VoiceId, Engine='standard', **kw):
+        self._admit()
+        time.sleep(self.latency)
+        return {'AudioStream': io.BytesIO(self.synth(Text, VoiceId, Engine)), 'RequestCharacters': billed_chars(Text)}
+
+    def start_speech_synthesis_task(self, Text, VoiceId, OutputS3BucketName, OutputS3KeyPrefix='', Engine='standard', **kw):
+        task_id = uuid.uuid4().hex
+        key = f"{OutputS3KeyPrefix}{task_id}.mp3"
+        task = {
+            'TaskId': task_id, 'TaskStatus': 'scheduled', 'VoiceId': VoiceId, 'Engine': Engine,
+            'RequestCharacters': billed_chars(Text),
+            'OutputUri': f"https://s3.{self.region}.amazonaws.com/{OutputS3BucketName}/{key}",
+        }
+        with self.lock:
+            self.tasks[task_id] = (task, Text, time.monotonic() + self.task_latency)
+        return {'SynthesisTask': dict(task)}
+
+    def get_speech_synthesis_task(self, TaskId):
+        with self.lock:
+            task, text, ready_at = self.tasks[TaskId]
+            if task['TaskStatus'] != 'completed':
+                if time.monotonic() < ready_at:
+                    task['TaskStatus'] = 'inProgress'
+                else:
+                    bucket, key = task['OutputUri'].split('/', 3)[3].split('/', 1)
+                    self.s3.put_object(Bucket=bucket, Key=key, Body=self.synth(text, task['VoiceId'], task['Engine']))
+                    task['TaskStatus'] = 'completed'
+            return {'SynthesisTask': dict(task)}
@@ -0,0 +1,116 @@
+"""
+Sync built audio into the app bundle.
+
+Free-tier tracks are bundled in full; pro-tier tracks are streamed, so only
+their preview clip goes into the bundle. Files are compared by SHA-256 and
+only changed ones are copied (or hard-linked with --link), each replaced
+atomically. Bundled files the catalog says should stream are reported, not
+deleted: lib/audioAssets.ts still require()s them.
+
+    python3 -m audiogen.sync [--link] [--dry-run] [--budget MB]
+
+Exits non-zero when the bundle is over budget.
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+
+from audiogen.catalog import OUTPUT_DIR
+from audiogen.preview import preview_path
+from audiogen.scan import BUNDLED_DIR, content_items
+
+BUDGET_MB = float(os.environ.get('DRIFTLAB_BUNDLE_BUDGET_MB', 80))
+
+
+def digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def same(a, b):
+    if not os.path.exists(b):
+        return False
+    sa, sb = os.stat(a), os.stat(b)
+    if (sa.st_dev, sa.st_ino) == (sb.st_dev, sb.st_ino):
+        return True
+    return sa.st_size == sb.st_size and digest(a) == digest(b)
+
+
+def place(src, dst, link=False):
+    tmp = dst + '.tmp'
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    try:
+        if not link: raise OSError
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+def plan(src_dir=OUTPUT_DIR, dst_dir=BUNDLED_DIR, items=None):
+    """[(source file, bundle file)] to ship, plus {'stream': [...], 'unlisted': [...]} for the report."""
+    items = content_items() if items is None else items
+    wanted, stream, unlisted = [], [], []
+    for name in sorted(os.listdir(src_dir)) if os.path.isdir(src_dir) else []:
+        if not name.endswith('.mp3') or name.endswith('.preview.mp3'):
+            continue
+        item = items.get(name)
+        if item is None:
+            unlisted.append(name)
+            continue
+        src = os.path.join(src_dir, name)
+        if item.get('tier') == 'pro':
+            stream.append(name)
+            src = preview_path(src)
+        for f in (src, os.path.splitext(src)[0] + '.wave'):
+            if os.path.exists(f):
+                wanted.append((f, os.path.join(dst_dir, os.path.basename(f))))
+    return wanted, {'stream': stream, 'unlisted': unlisted}
+
+
+def sync(src_dir=OUTPUT_DIR, dst_dir=BUNDLED_DIR, link=False, dry_run=False, items=None):
+    """Bring `dst_dir` up to date; returns a report dict."""
+    wanted, report = plan(src_dir, dst_dir, items)
+    changed = [(s, d) for s, d in wanted if not same(s, d)]
+    if not dry_run:
+        os.makedirs(dst_dir, exist_ok=True)
+        for s, d in changed:
+            place(s, d, link)
+    streamed = set(report['stream'])
+    report['changed'] = [os.path.basename(d) for _, d in changed]
+    report['unchanged'] = len(wanted) - len(changed)
+    report['bundled_stream'] = sorted(n for n in os.listdir(dst_dir) if n in streamed) if os.path.isdir(dst_dir) else []
+    report['bytes'] = sum(os.path.getsize(os.path.join(dst_dir, n)) for n in os.listdir(dst_dir)) \
+        if os.path.isdir(dst_dir) else 0
+    return report
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Copy changed audio into the app bundle and check its size.')
+    ap.add_argument('--src', default=OUTPUT_DIR)
+    ap.add_argument('--dst', default=BUNDLED_DIR)
+    ap.add_argument('--link', action='store_true', help='hard-link instead of copying where possible')
+    ap.add_argument('--dry-run', action='store_true')
+    ap.add_argument('--budget', type=float, default=BUDGET_MB, help='bundle budget in MB')
+    args = ap.parse_args()
+
+    r = sync(args.src, args.dst, args.link, args.dry_run)
+    verb = 'would update' if args.dry_run else 'updated'
+    for name in r['changed']:
+        print(f"  {verb} {name}")
+    print(f"{len(r['changed'])} {verb}, {r['unchanged']} unchanged, {len(r['stream'])} streamed (preview only)")
+    for name in r['bundled_stream']:
+        print(f"  {name} is pro-tier but still bundled: drop it from lib/audioAssets.ts and {args.dst}/")
+    if r['unlisted']:
+        print(f"  not in the catalog, skipped: {', '.join(r['unlisted'])}")
+    mb = r['bytes'] / 1024 / 1024
+    print(f"Bundle: {mb:.1f} MB of {args.budget:.0f} MB budget")
+    if mb > args.budget:
+        print(f"ERROR: bundle is {mb - args.budget:.1f} MB over budget")
+        sys.exit(1)
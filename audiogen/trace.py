@@ -0,0 +1,94 @@
+"""
+Span tracing for the build pipeline, exported as Chrome trace JSON
+(open in chrome://tracing or https://ui.perfetto.dev).
+
+    with trace.span('synthesize', track=slug, part=2):
+        ...
+
+Off by default; span() then returns a shared no-op context, so instrumented
+code costs one function call. Worker processes trace into their own buffer
+and hand events back with drain(); the parent merges them with extend().
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+
+ENABLED = False
+NULL = contextlib.nullcontext()
+
+_events = []
+_named = set()
+_lock = threading.Lock()
+
+
+def enable(on=True):
+    global ENABLED
+    ENABLED = on
+
+
+def now():
+    return time.perf_counter_ns() // 1000
+
+
+def _emit(event):
+    pid, tid = os.getpid(), threading.get_ident()
+    event['pid'], event['tid'] = pid, tid
+    with _lock:
+        if (pid, tid) not in _named:
+            _named.add((pid, tid))
+            _events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                            'args': {'name': threading.current_thread().name}})
+        _events.append(event)
+
+
+class _Span:
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name, args):
+        self.name, self.args = name, args
+
+    def __enter__(self):
+        self.start = now()
+        return self
+
+    def __exit__(self, *exc):
+        _emit({'name': self.name, 'ph': 'X', 'ts': self.start, 'dur': now() - self.start, 'args': self.args})
+
+
+def span(name, **args):
+    """Time a nested block on the current thread."""
+    return _Span(name, args) if ENABLED else NULL
+
+
+def begin(name, key, **args):
+    """Start an async span (e.g. a track's whole life across threads and processes)."""
+    if ENABLED:
+        _emit({'name': name, 'cat': name, 'ph': 'b', 'id': key, 'ts': now(), 'args': args})
+
+
+def end(name, key, **args):
+    if ENABLED:
+        _emit({'name': name, 'cat': name, 'ph': 'e', 'id': key, 'ts': now(), 'args': args})
+
+
+def drain():
+    """Take this process's events (for handing back from a worker)."""
+    global _events
+    with _lock:
+        events, _events = _events, []
+    return events
+
+
+def extend(events):
+    with _lock:
+        _events.extend(events)
+
+
+def export(path):
+    """Write everything recorded so far as Chrome trace JSON; returns the event count."""
+    events = drain()
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+    return len(events)
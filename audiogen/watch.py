@@ -0,0 +1,117 @@
+"""
+Watch mode: rebuild only what an edit touched.
+
+Polls scripts/ (the index and every .ssml file); once saves settle for
+DEBOUNCE seconds, the catalog is re-read and each track's parts are compared
+with the last build. Changed tracks are rebuilt through the part cache, so
+only the edited parts go to Polly and the edit-to-listen loop is about one
+request long.
+
+    python3 -m audiogen.watch [--backend polly|draft] [--workers N] [--smooth]
+
+The first run takes the current scripts as already built; delete
+.driftlab/watch.json to force a rebuild of everything.
+"""
+import argparse
+import glob
+import json
+import os
+import time
+import traceback
+
+from audiogen import backends, catalog
+from audiogen.cache import PartCache, part_key
+from audiogen.pipeline import build
+from audiogen.scheduler import WORKERS
+
+STATE = './.driftlab/watch.json'
+POLL = 0.3
+DEBOUNCE = 0.75
+
+
+def snapshot():
+    files = [catalog.INDEX] + glob.glob(os.path.join(catalog.SCRIPTS_DIR, '*.ssml'))
+    return {f: os.stat(f).st_mtime_ns for f in files if os.path.exists(f)}
+
+
+def settle(last):
+    """Block until scripts/ changes and then stays unchanged for DEBOUNCE; returns (snapshot, changed files)."""
+    while (snap := snapshot()) == last:
+        time.sleep(POLL)
+    quiet = time.monotonic()
+    while time.monotonic() - quiet < DEBOUNCE:
+        time.sleep(POLL)
+        if (nxt := snapshot()) != snap:
+            snap, quiet = nxt, time.monotonic()
+    return snap, sorted(f for f in set(snap) | set(last) if snap.get(f) != last.get(f))
+
+
+def fingerprint(track, backend):
+    return [part_key(p, track.voice, track.engine, backend.name) for p in track.parts]
+
+
+def load_state(path=STATE):
+    try:
+        with open(path) as f: return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_state(state, path=STATE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w') as f: json.dump(state, f)
+    os.replace(path + '.tmp', path)
+
+
+def changed(tracks, state, backend):
+    """Tracks whose parts differ from the last build, and how many of their parts changed."""
+    out = []
+    for t in tracks:
+        new, old = fingerprint(t, backend), state.get(t.slug) or []
+        if new != old:
+            out.append((t, len(set(new) - set(old))))
+    return out
+
+
+def watch(backend=None, workers=WORKERS, smooth=False, state_path=STATE):
+    backend = backends.get(backend) if not isinstance(backend, backends.Backend) else backend
+    cache = PartCache()
+    state = load_state(state_path)
+    if state is None:
+        state = {t.slug: fingerprint(t, backend) for t in catalog.load()}
+        save_state(state, state_path)
+    snap = snapshot()
+    print(f"Watching {len(snap)} script files ({len(state)} tracks, backend {backend.name}). Ctrl-C to stop.")
+    while True:
+        snap, edited = settle(snap)
+        print(f"\n{', '.join(os.path.basename(f) for f in edited)} changed")
+        try:
+            tracks = catalog.reload()
+        except Exception:
+            traceback.print_exc()
+            continue
+        todo = changed(tracks, state, backend)
+        if not todo:
+            print("  no track changed")
+            continue
+        for t, n in todo:
+            print(f"  {t.slug}: {n} of {len(t.parts)} part(s) changed")
+        start = time.perf_counter()
+        built = build([t for t, _ in todo], workers=workers, backend=backend, smooth=smooth, cache=cache)
+        for t, _ in todo:
+            if t.slug in built and not built[t.slug]['problems']:
+                state[t.slug] = fingerprint(t, backend)
+        save_state(state, state_path)
+        print(f"  rebuilt {len(built)} track(s) in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Rebuild tracks as their generator scripts are edited.')
+    ap.add_argument('--backend', choices=sorted(backends.BACKENDS), help='default: $DRIFTLAB_BACKEND or polly')
+    ap.add_argument('--workers', type=int, default=WORKERS)
+    ap.add_argument('--smooth', action='store_true', help='trim and crossfade part seams')
+    args = ap.parse_args()
+    try:
+        watch(args.backend, args.workers, args.smooth)
+    except KeyboardInterrupt:
+        pass
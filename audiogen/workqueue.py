@@ -0,0 +1,338 @@
+"""
+Distributed builds: a lease-based work queue shared by several build hosts.
+
+A coordinator submits a build: one job per part (longest first, like the
+local scheduler) and one assembly job per track that becomes claimable once
+all of its parts are done. Workers, on any host that sees the same queue
+database, part cache and output directory, claim jobs under a LEASE,
+heartbeat while they work, and push synthesized parts into the shared
+audiogen.cache.PartCache; assembly pulls them back out and runs the usual
+post steps. A lease that runs out (a worker died or hung) puts the job back
+in the queue; after MAX_ATTEMPTS it fails, and so does its track. Every
+claim gets its own token, and only its holder can heartbeat, complete or
+give the job back. A track whose post steps report problems fails without
+a retry. Claims are one short SQLite transaction, so throughput grows with
+the number of workers until Polly itself is the limit.
+
+    python3 -m audiogen.workqueue submit [slug ...] [--backend polly|draft] [--smooth]
+    python3 -m audiogen.workqueue work [--threads 4] [--backend ...] [--follow]
+    python3 -m audiogen.workqueue status
+
+The queue is SQLite (DRIFTLAB_QUEUE, default .driftlab/queue.db): fine on one
+machine or a shared disk with working locks; not for object storage.
+"""
+import argparse
+import json
+import os
+import shutil
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+from audiogen import backends
+from audiogen.cache import PartCache, part_key
+from audiogen.catalog import Track, load
+from audiogen.ledger import Ledger
+from audiogen.pipeline import assemble, gen, post_steps
+from audiogen.scheduler import WORKERS, Job, jobs
+
+QUEUE = os.environ.get('DRIFTLAB_QUEUE', './.driftlab/queue.db')
+LEASE = 60.0
+HEARTBEAT = LEASE / 4
+MAX_ATTEMPTS = 3
+POLL = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY, build TEXT, kind TEXT, slug TEXT, part INTEGER, priority REAL,
+    payload TEXT, state TEXT, waiting INTEGER, worker TEXT, token TEXT, lease_until REAL,
+    attempts INTEGER DEFAULT 0, error TEXT, result TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, kind, priority);
+CREATE INDEX IF NOT EXISTS jobs_track ON jobs (build, slug);
+"""
+COLUMNS = ('id', 'build', 'kind', 'slug', 'part', 'payload', 'worker', 'attempts')
+OPEN = ('waiting', 'queued', 'leased')
+
+
+def track_dict(track):
+    return {'name': track.name, 'slug': track.slug, 'voice': track.voice, 'engine': track.engine,
+            'group': track.group, 'parts': track.parts}
+
+
+class WorkQueue:
+    def __init__(self, path=QUEUE):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript(SCHEMA)
+        # Queues from before claims carried a token.
+        if 'token' not in {r[1] for r in self.db.execute("PRAGMA table_info(jobs)")}:
+            self.db.execute("ALTER TABLE jobs ADD COLUMN token TEXT")
+        self.lock = threading.Lock()
+
+    def _tx(self, fn, *args):
+        with self.lock:
+            self.db.execute('BEGIN IMMEDIATE')
+            try:
+                out = fn(*args)
+            except BaseException:
+                self.db.execute('ROLLBACK')
+                raise
+            self.db.execute('COMMIT')
+            return out
+
+    def submit(self, tracks, backend, out_dir=None, smooth=False):
+        """Queue every part and track of a build; returns the build id."""
+        build = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        opts = {'backend': backend, 'out_dir': out_dir, 'smooth': smooth}
+
+        def insert():
+            for j in jobs(tracks):
+                payload = {**opts, 'track': {**track_dict(j.track), 'parts': None}, 'index': j.index, 'ssml': j.ssml}
+                self.db.execute("INSERT INTO jobs (build, kind, slug, part, priority, payload, state) "
+                                "VALUES (?, 'part', ?, ?, ?, ?, 'queued')",
+                                (build, j.track.slug, j.index + 1, j.cost, json.dumps(payload)))
+            for t in tracks:
+                self.db.execute("INSERT INTO jobs (build, kind, slug, priority, payload, state, waiting) "
+                                "VALUES (?, 'track', ?, 0, ?, 'waiting', ?)",
+                                (build, t.slug, json.dumps({**opts, 'track': track_dict(t)}), len(t.parts)))
+        self._tx(insert)
+        return build
+
+    def _expire(self, now):
+        """Re-queue jobs whose lease ran out; fail the ones out of attempts, and their tracks."""
+        self.db.execute("UPDATE jobs SET state='failed', error='lease expired ' || attempts || ' times' "
+                        "WHERE state='leased' AND lease_until < ? AND attempts >= ?", (now, MAX_ATTEMPTS))
+        self.db.execute("UPDATE jobs SET state='queued', worker=NULL, token=NULL "
+                        "WHERE state='leased' AND lease_until < ?", (now,))
+        self.db.execute("UPDATE jobs SET state='failed', error='a part failed' WHERE kind='track' AND state='waiting' "
+                        "AND EXISTS (SELECT 1 FROM jobs p WHERE p.build=jobs.build AND p.slug=jobs.slug "
+                        "AND p.kind='part' AND p.state='failed')")
+
+    def claim(self, worker, lease=LEASE):
+        """Lease the next job (ready tracks first, then the longest part), or None."""
+        def take():
+            now = time.time()
+            self._expire(now)
+            row = self.db.execute(f"SELECT {', '.join(COLUMNS)} FROM jobs WHERE state='queued' "
+                                  "ORDER BY kind='track' DESC, priority DESC, id LIMIT 1").fetchone()
+            if row is None:
+                return None
+            token = uuid.uuid4().hex
+            self.db.execute("UPDATE jobs SET state='leased', worker=?, token=?, lease_until=?, attempts=attempts+1 "
+                            "WHERE id=?", (worker, token, now + lease, row[0]))
+            job = dict(zip(COLUMNS, row), worker=worker, token=token)
+            job['payload'], job['attempts'] = json.loads(job['payload']), job['attempts'] + 1
+            return job
+        return self._tx(take)
+
+    def heartbeat(self, job, lease=LEASE):
+        """Extend the lease; False if it was lost (expired and taken by someone else)."""
+        with self.lock:
+            cur = self.db.execute("UPDATE jobs SET lease_until=? WHERE id=? AND token=? AND state='leased'",
+                                  (time.time() + lease, job['id'], job['token']))
+            return cur.rowcount == 1
+
+    def complete(self, job, result=None):
+        def done():
+            cur = self.db.execute("UPDATE jobs SET state='done', result=? WHERE id=? AND token=? AND state='leased'",
+                                  (json.dumps(result), job['id'], job['token']))
+            if cur.rowcount and job['kind'] == 'part':
+                self.db.execute("UPDATE jobs SET waiting=waiting-1, state=CASE WHEN waiting<=1 THEN 'queued' "
+                                "ELSE state END WHERE build=? AND slug=? AND kind='track' AND state='waiting'",
+                                (job['build'], job['slug']))
+            return cur.rowcount == 1
+        return self._tx(done)
+
+    def fail(self, job, error, retry=True):
+        """Give the job back for another try, or fail it (after MAX_ATTEMPTS, or now without `retry`)."""
+        def give_back():
+            state = 'failed' if not retry or job['attempts'] >= MAX_ATTEMPTS else 'queued'
+            self.db.execute("UPDATE jobs SET state=?, worker=NULL, token=NULL, error=? "
+                            "WHERE id=? AND token=? AND state='leased'", (state, str(error), job['id'], job['token']))
+            self._expire(time.time())
+        self._tx(give_back)
+
+    def counts(self, build=None):
+        """{(kind, state): n}, for one build or the whole queue."""
+        where, args = ('WHERE build=?', (build,)) if build else ('', ())
+        with self.lock:
+            rows = self.db.execute(f"SELECT kind, state, COUNT(*) FROM jobs {where} GROUP BY kind, state", args)
+            return {(k, s): n for k, s, n in rows}
+
+    def idle(self, build=None):
+        return not any(s in OPEN for (_, s) in self.counts(build))
+
+    def results(self, build):
+        """{slug: (state, result or error)} for every track of a build."""
+        with self.lock:
+            rows = self.db.execute("SELECT slug, state, result, error FROM jobs WHERE build=? AND kind='track'",
+                                   (build,))
+            return {slug: (state, json.loads(result) if result else error) for slug, state, result, error in rows}
+
+
+class Problems(Exception):
+    """A track built but its post steps found problems; building it again would not help."""
+
+
+class Heartbeat:
+    """Keeps a job's lease alive from a background thread while the block runs."""
+
+    def __init__(self, queue, job):
+        self.queue, self.job = queue, job
+        self.stop, self.lost = threading.Event(), False
+
+    def _beat(self):
+        while not self.stop.wait(HEARTBEAT):
+            if not self.queue.heartbeat(self.job):
+                self.lost = True
+                return
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self._beat, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop.set()
+        self.thread.join()
+
+
+class Worker:
+    def __init__(self, queue, threads=WORKERS, cache=None, name=None, ledger=None, backend=None):
+        self.queue, self.threads = queue, threads
+        self.cache = cache or PartCache()
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.ledger = Ledger() if ledger is None else ledger
+        self.backend = backend
+        self.backends, self.lock = {}, threading.Lock()
+        self.done = self.failed = 0
+
+    def _backend(self, name):
+        """The worker's backend if it was given one (e.g. a stand-in), else one shared instance per name."""
+        if self.backend is not None:
+            return self.backend
+        with self.lock:
+            if name not in self.backends:
+                self.backends[name] = backends.get(name)
+                self.backends[name].reserve(self.threads)
+            return self.backends[name]
+
+    def part(self, job, scratch):
+        p = job['payload']
+        backend = self._backend(p['backend'])
+        part = Job(_track(p['track']), p['index'], p['ssml'])
+
+        def record(**row):
+            self.ledger.record(build=job['build'], workers=self.threads, backend=backend.name, **row)
+
+        fp = gen(part, backend, scratch, record if self.ledger else None, self.cache)
+        if fp is None:
+            raise RuntimeError(f"part {job['part']} of {job['slug']} was not synthesized")
+        os.remove(fp)
+        return {'key': part_key(p['ssml'], part.track.voice, part.track.engine, backend.name)}
+
+    def track(self, job, scratch):
+        p = job['payload']
+        backend = self._backend(p['backend'])
+        track = _track(p['track'])
+        out_dir = p['out_dir'] or backend.out_dir
+        os.makedirs(out_dir, exist_ok=True)
+        paths = []
+        for i, ssml in enumerate(track.parts):
+            fp = os.path.join(scratch, Job(track, i, ssml).filename)
+            if not self.cache.get(part_key(ssml, track.voice, track.engine, backend.name), fp):
+                raise RuntimeError(f"part {i + 1} of {track.slug} is not in the cache")
+            paths.append(fp)
+        post, smooth = post_steps((), p['smooth'])
+        info = assemble(track, paths, os.path.join(out_dir, track.filename), post, False, smooth)
+        if info['problems']:
+            raise Problems('; '.join(info['problems']))
+        print(f"  >> {track.filename} ({info['bytes']/1024/1024:.1f} MB)")
+        return {k: info[k] for k in ('path', 'bytes', 'seconds', 'problems', 'warnings')}
+
+    def _loop(self, follow):
+        scratch = tempfile.mkdtemp(prefix='driftlab-worker-')
+        try:
+            while True:
+                job = self.queue.claim(self.name)
+                if job is None:
+                    if not follow and self.queue.idle():
+                        return
+                    time.sleep(POLL)
+                    continue
+                try:
+                    with Heartbeat(self.queue, job) as beat:
+                        result = (self.track if job['kind'] == 'track' else self.part)(job, scratch)
+                    if beat.lost or not self.queue.complete(job, result):
+                        print(f"    lease lost on {job['kind']} {job['slug']} {job['part'] or ''}: result dropped")
+                        continue
+                    with self.lock:
+                        self.done += 1
+                except Exception as e:
+                    print(f"    ERROR {job['kind']} {job['slug']} {job['part'] or ''}: {e}")
+                    self.queue.fail(job, e, retry=not isinstance(e, Problems))
+                    with self.lock:
+                        self.failed += 1
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    def run(self, follow=False):
+        """Work until the queue has nothing open (or forever with `follow`); returns (done, failed)."""
+        pool = [threading.Thread(target=self._loop, args=(follow,), name=f"work-{i}") for i in range(self.threads)]
+        for t in pool: t.start()
+        for t in pool: t.join()
+        return self.done, self.failed
+
+
+def _track(d):
+    return Track(d['name'], d['slug'], d['voice'], d['engine'], d.get('group'), d.get('parts'))
+
+
+def wait(queue, build, poll=1.0):
+    """Block until every job of `build` is done or failed; returns queue.results(build)."""
+    last = None
+    while not queue.idle(build):
+        counts = queue.counts(build)
+        if counts != last:
+            parts = sum(n for (k, s), n in counts.items() if k == 'part' and s == 'done')
+            total = sum(n for (k, _), n in counts.items() if k == 'part')
+            tracks = sum(n for (k, s), n in counts.items() if k == 'track' and s == 'done')
+            print(f"  {parts}/{total} parts, {tracks} tracks done")
+            last = counts
+        time.sleep(poll)
+    return queue.results(build)
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Distributed catalog builds over a shared work queue.')
+    ap.add_argument('command', choices=('submit', 'work', 'status'))
+    ap.add_argument('slugs', nargs='*', help='tracks to submit (default: all)')
+    ap.add_argument('--backend', choices=sorted(backends.BACKENDS), help='default: $DRIFTLAB_BACKEND or polly')
+    ap.add_argument('--smooth', action='store_true', help='trim and crossfade part seams')
+    ap.add_argument('--wait', action='store_true', help='after submitting, wait for the build to finish')
+    ap.add_argument('--threads', type=int, default=WORKERS, help='jobs this worker runs at once')
+    ap.add_argument('--follow', action='store_true', help='keep waiting for new jobs when the queue is empty')
+    ap.add_argument('--queue', default=QUEUE)
+    args = ap.parse_args()
+
+    q = WorkQueue(args.queue)
+    if args.command == 'submit':
+        backend = backends.get(args.backend)
+        tracks = [t for t in backend.prepare(load(args.slugs)) if t.parts]
+        build = q.submit(tracks, backend.name, smooth=args.smooth)
+        print(f"Submitted {build}: {sum(len(t.parts) for t in tracks)} parts, {len(tracks)} tracks")
+        if args.wait:
+            for slug, (state, r) in sorted(wait(q, build).items()):
+                print(f"  {slug:<28} {state}{'' if state == 'done' else ': ' + str(r)}")
+    elif args.command == 'work':
+        done, failed = Worker(q, args.threads).run(args.follow)
+        print(f"\n{done} jobs done, {failed} failed")
+    else:
+        for (kind, state), n in sorted(q.counts().items()):
+            print(f"  {kind:<6} {state:<8} {n:>6}")
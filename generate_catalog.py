@@ -0,0 +1,73 @@
+"""
+DriftLab Full Catalog Build
+Every part of every registered track shares one worker pool, longest first,
+so the build takes roughly total synthesis work / workers.
+--backend tasks sends each whole script as one Polly synthesis task (needs
+DRIFTLAB_CONTENT_BUCKET); --backend draft builds offline in seconds.
+--trace build.json writes a Chrome/Perfetto trace of every pipeline stage.
+--smooth trims and crossfades the seams between parts instead of byte-appending.
+--sync copies changed tracks into assets/audio afterwards (see audiogen.sync).
+--hls also packages every track as content-addressed HLS segments (see audiogen.hls).
+--release uploads the output under versioned keys and repoints release.json (see audiogen.release).
+Parts whose SSML has not changed are reused from .driftlab/parts/ (--no-cache
+to synthesize everything). After a real build the duration model is refitted from the new audio.
+Run: python3 generate_catalog.py [--workers 8] [--backend polly|tasks|draft] [--trace FILE] [--smooth] [--sync] [--hls] [--release] [--no-cache] [--dry-run] [slug ...]
+"""
+import argparse
+
+from audiogen import backends, durations, hls, release, sync, trace
+from audiogen.cache import PartCache
+from audiogen.catalog import load
+from audiogen.pipeline import build
+from audiogen.scheduler import WORKERS, jobs, makespan
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Build the whole DriftLab catalog (or the named tracks).')
+    ap.add_argument('slugs', nargs='*', help='track slugs to build (default: all)')
+    ap.add_argument('--workers', type=int, default=WORKERS)
+    ap.add_argument('--backend', choices=sorted(backends.BACKENDS), help='default: $DRIFTLAB_BACKEND or polly')
+    ap.add_argument('--trace', metavar='FILE', help='write a Chrome trace (chrome://tracing, Perfetto) of the build')
+    ap.add_argument('--smooth', action='store_true', help='trim and crossfade part seams (needs numpy, ffmpeg)')
+    ap.add_argument('--sync', action='store_true', help='update the app bundle from the build output')
+    ap.add_argument('--hls', action='store_true', help='package tracks as HLS with content-addressed segments')
+    ap.add_argument('--release', action='store_true', help='upload the output to the content bucket and CDN')
+    ap.add_argument('--no-cache', action='store_true', help='synthesize every part, even unchanged ones')
+    ap.add_argument('--dry-run', action='store_true', help='print the schedule estimate and exit')
+    args = ap.parse_args()
+
+    backend = backends.get(args.backend)
+    tracks = backend.prepare(load(args.slugs))
+    if backend.name == 'tasks':
+        args.workers = max(args.workers, len(tracks))
+    costs = [j.cost for j in jobs(tracks)]
+    total = sum(costs)
+    print(f"\nDriftLab Catalog: {len(tracks)} tracks, {len(costs)} parts | Backend: {backend.name} "
+          f"| Workers: {args.workers} | Output: {backend.out_dir}/")
+    audio = sum(durations.predict_track(t) for t in tracks)
+    print(f"Predicted audio {audio / 60:.0f} min | Estimated work {total:.0f}s, "
+          f"makespan {makespan(costs, args.workers):.0f}s (ideal {total / args.workers:.0f}s)\n")
+    if not args.dry_run:
+        trace.enable(bool(args.trace))
+        build(tracks, workers=args.workers, backend=backend, smooth=args.smooth,
+              post=(hls.step,) if args.hls else (), cache=None if args.no_cache else PartCache())
+        print(f"\nDone! {len(tracks)} tracks complete.")
+        if backend.name == 'polly' and hasattr(backend.client, 'stats'):
+            for s in backend.client.stats():
+                print(f"  {s['region']:<14} {s['requests']:>5} requests {s['failures']:>4} failed  {s['latency_ms']} ms")
+        if backend.name == 'polly':
+            s = backend.pooled.stats()
+            print(f"  connection pool: {s['size']} connections, {s['requests']} requests, "
+                  f"waited {s['wait_total']:.1f}s in total (max {s['wait_max']:.2f}s)")
+        if backend.name != 'draft':
+            model, n = durations.calibrate(load())
+            print(f"Duration model refitted from {n} built tracks.")
+        if args.sync and backend.name != 'draft':
+            r = sync.sync()
+            print(f"Bundle synced: {len(r['changed'])} updated, {r['bytes'] / 1024 / 1024:.1f} MB "
+                  f"of {sync.BUDGET_MB:.0f} MB budget{' (OVER BUDGET)' if r['bytes'] > sync.BUDGET_MB * 1024 * 1024 else ''}")
+        if args.release and backend.name != 'draft':
+            r = release.release(backend.out_dir)
+            print(f"Released {r['release'] or '(nothing changed)'}: {r['uploaded']} objects uploaded "
+                  f"({r['bytes'] / 1024 / 1024:.1f} MB), {len(r['changed'])} changed")
+        if args.trace:
+            print(f"Trace: {args.trace} ({trace.export(args.trace)} events)")
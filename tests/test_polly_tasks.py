@@ -0,0 +1,67 @@
+import os
+import time
+
+import pytest
+
+from audiogen.polly_tasks import TASK_PREFIX, TaskBatch
+from audiogen.standins import LocalPolly, LocalS3
+
+SSML = '<speak>Breathe in, and let the day go.</speak>'
+
+
+class RecordingPolly(LocalPolly):
+    """LocalPolly that logs every status poll and fails tasks whose text says so."""
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self.polls = []
+
+    def get_speech_synthesis_task(self, TaskId):
+        self.polls.append((time.monotonic(), TaskId))
+        r = super().get_speech_synthesis_task(TaskId)
+        if 'FAIL' in self.tasks[TaskId][1] and r['SynthesisTask']['TaskStatus'] == 'completed':
+            r['SynthesisTask'].update(TaskStatus='failed', TaskStatusReason='invalid SSML')
+        return r
+
+
+@pytest.fixture
+def s3(tmp_path):
+    return LocalS3(str(tmp_path))
+
+
+def test_completed_task_is_downloaded_and_deleted(s3, tmp_path):
+    polly = RecordingPolly(s3, task_latency=0.05)
+    batch = TaskBatch(polly, s3, bucket='content', interval=0.01)
+    audio = batch.synthesize(SSML, 'Ruth', 'long-form')
+    assert audio == polly.synth(SSML, 'Ruth', 'long-form')
+    assert not os.listdir(tmp_path / 'content' / TASK_PREFIX.strip('/'))
+
+
+def test_failed_task_raises(s3):
+    batch = TaskBatch(RecordingPolly(s3, task_latency=0.0), s3, bucket='content', interval=0.01)
+    with pytest.raises(RuntimeError, match='invalid SSML'):
+        batch.synthesize('<speak>FAIL</speak>', 'Ruth', 'long-form')
+
+
+def test_polling_backs_off_while_nothing_finishes(s3):
+    polly = RecordingPolly(s3, task_latency=1.0)
+    batch = TaskBatch(polly, s3, bucket='content', interval=0.05, max_interval=0.4)
+    batch.synthesize(SSML, 'Ruth', 'long-form')
+    # Doubling from 0.05s: about 6 polls in the second it takes, against 20 at a fixed interval.
+    assert 3 <= len(polly.polls) <= 9
+    gaps = [b - a for (a, _), (b, _) in zip(polly.polls, polly.polls[1:])]
+    assert max(gaps) > 4 * min(gaps)
+
+
+def test_new_task_wakes_a_backed_off_poller(s3):
+    polly = RecordingPolly(s3, task_latency=3.0)
+    batch = TaskBatch(polly, s3, bucket='content', interval=0.5, max_interval=10.0)
+    batch.submit(SSML, 'Ruth', 'long-form')
+    time.sleep(0.7)
+    start = time.monotonic()
+    second = batch.submit(SSML, 'Ruth', 'neural')
+    time.sleep(0.2)
+    task_id = next(t for t, (task, _, _) in polly.tasks.items() if task['Engine'] == 'neural')
+    # Without the wake the next round would be a second or more away.
+    assert any(at >= start and tid == task_id for at, tid in polly.polls)
+    assert not second.done()
@@ -0,0 +1,76 @@
+import json
+import os
+
+import pytest
+
+from audiogen.release import POINTER, release
+from audiogen.standins import LocalCloudFront, LocalS3
+
+BUCKET = 'content'
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f: f.write(data)
+
+
+@pytest.fixture
+def out(tmp_path):
+    src = tmp_path / 'out'
+    write(src / 'story-01.mp3', b'story one')
+    write(src / 'story-01.wave', b'waveform')
+    write(src / 'hls' / 'story-01.m3u8', b'#EXTM3U')
+    write(src / 'hls' / 'segments' / 'a1b2c3.mp3', b'segment')
+    return src
+
+
+@pytest.fixture
+def cloud(tmp_path):
+    s3 = LocalS3(str(tmp_path / 's3'))
+    return s3, LocalCloudFront(s3, BUCKET)
+
+
+def run(out, cloud):
+    s3, cdn = cloud
+    return release(str(out), s3, cdn, BUCKET, 'local')
+
+
+def pointer(cloud):
+    return json.loads(cloud[0].get_object(Bucket=BUCKET, Key=POINTER)['Body'].read())['objects']
+
+
+def test_first_release_uploads_everything_and_invalidates_the_pointer(out, cloud):
+    r = run(out, cloud)
+    assert (r['objects'], r['uploaded']) == (4, 4)
+    assert [i['InvalidationBatch']['Paths']['Items'] for i in cloud[1].invalidations] == [['/' + POINTER]]
+    for rel, key in pointer(cloud).items():
+        assert cloud[0].get_object(Bucket=BUCKET, Key=key)['Body'].read() == (out / rel).read_bytes()
+
+
+def test_unchanged_release_uploads_nothing(out, cloud):
+    run(out, cloud)
+    r = run(out, cloud)
+    assert (r['release'], r['uploaded'], r['invalidated']) == (None, 0, [])
+    assert len(cloud[1].invalidations) == 1
+
+
+def test_changed_file_uploads_only_its_key(out, cloud):
+    run(out, cloud)
+    before = pointer(cloud)
+    write(out / 'story-01.mp3', b'story one, re-recorded')
+    r = run(out, cloud)
+    after = pointer(cloud)
+    assert (r['uploaded'], r['changed']) == (1, ['story-01.mp3'])
+    assert after['story-01.mp3'] != before['story-01.mp3']
+    assert {k: v for k, v in after.items() if k != 'story-01.mp3'} == \
+        {k: v for k, v in before.items() if k != 'story-01.mp3'}
+    assert len(cloud[1].invalidations) == 2
+
+
+def test_keys_are_versioned_except_hls_segments(out, cloud):
+    run(out, cloud)
+    keys = pointer(cloud)
+    assert keys['hls/segments/a1b2c3.mp3'] == 'hls/segments/a1b2c3.mp3'
+    stem, sha, ext = keys['story-01.mp3'].split('.')
+    assert (stem, len(sha), ext) == ('story-01', 12, 'mp3')
+    assert keys['hls/story-01.m3u8'].startswith('hls/story-01.')
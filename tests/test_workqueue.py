@@ -0,0 +1,85 @@
+import pytest
+
+from audiogen import workqueue
+from audiogen.backends import PollyBackend
+from audiogen.cache import PartCache
+from audiogen.catalog import Track
+from audiogen.standins import LocalPolly
+from audiogen.workqueue import MAX_ATTEMPTS, Worker, WorkQueue
+
+EXPIRED = -1.0
+
+
+def track(slug='wq-test', parts=2):
+    ssml = [f"<speak>Part {i + 1}. Breathe in, and let the day go.</speak>" for i in range(parts)]
+    return Track('Work queue test', slug, text=ssml)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return WorkQueue(str(tmp_path / 'queue.db'))
+
+
+def test_expired_lease_is_requeued(queue):
+    build = queue.submit([track(parts=1)], 'draft')
+    first = queue.claim('host:1', lease=EXPIRED)
+    again = queue.claim('host:2')
+    assert (again['id'], again['attempts'], again['worker']) == (first['id'], 2, 'host:2')
+    assert queue.complete(again, {})
+    assert queue.counts(build)[('part', 'done')] == 1
+
+
+def test_job_fails_after_max_attempts_and_takes_its_track(queue):
+    build = queue.submit([track(parts=1)], 'draft')
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        job = queue.claim('host:1', lease=EXPIRED)
+        assert (job['kind'], job['attempts']) == ('part', attempt)
+    assert queue.claim('host:1') is None
+    assert queue.counts(build) == {('part', 'failed'): 1, ('track', 'failed'): 1}
+    assert queue.idle(build)
+
+
+def test_track_is_claimable_only_after_its_last_part(queue):
+    queue.submit([track(parts=2)], 'draft')
+    first = queue.claim('host:1')
+    second = queue.claim('host:1')
+    assert {first['kind'], second['kind']} == {'part'}
+    assert queue.claim('host:1') is None
+    assert queue.complete(first, {})
+    assert queue.claim('host:1') is None
+    assert queue.complete(second, {})
+    job = queue.claim('host:1')
+    assert (job['kind'], job['slug']) == ('track', 'wq-test')
+
+
+def test_stale_claim_cannot_touch_a_reclaimed_job(queue):
+    build = queue.submit([track(parts=1)], 'draft')
+    # Same worker name: two threads of one process.
+    stale = queue.claim('host:1', lease=EXPIRED)
+    fresh = queue.claim('host:1')
+    assert fresh['id'] == stale['id']
+    assert not queue.heartbeat(stale)
+    assert not queue.complete(stale, {})
+    queue.fail(stale, 'late')
+    assert queue.counts(build)[('part', 'leased')] == 1
+    assert queue.complete(fresh, {})
+
+
+def test_track_with_problems_fails_without_retry(queue):
+    build = queue.submit([track(parts=1)], 'draft')
+    queue.complete(queue.claim('host:1'), {})
+    job = queue.claim('host:1')
+    queue.fail(job, 'duration off by 12s', retry=False)
+    state, error = queue.results(build)['wq-test']
+    assert (state, error) == ('failed', 'duration off by 12s')
+
+
+def test_worker_builds_with_standins(queue, tmp_path, monkeypatch):
+    monkeypatch.setattr(workqueue, 'POLL', 0.01)
+    build = queue.submit([track(parts=2)], 'polly', out_dir=str(tmp_path / 'out'))
+    worker = Worker(queue, threads=2, cache=PartCache(str(tmp_path / 'parts')), ledger=False,
+                    backend=PollyBackend(LocalPolly()))
+    done, failed = worker.run()
+    state, result = queue.results(build)['wq-test']
+    assert (done, failed, state) == (3, 0, 'done')
+    assert result['bytes'] > 0